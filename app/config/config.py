@@ -1,19 +1,24 @@
-import os
+from functools import lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
-from redis import asyncio as aioredis
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
     Pydantic automatically loads these from env vars - no need for os.getenv()!
+    Fields without a default are required and fail fast at startup.
     """
 
     # Application settings
     APP_NAME: str = "ServiPal"
     DEBUG: bool = False
     ENVIRONMENT: str = "development"
+    # Minimum log level (e.g. "WARNING"); defaults to DEBUG/INFO from DEBUG
+    LOG_LEVEL: Optional[str] = None
+    # Form-encoded /api/v1/auth/token used by the Swagger UI "Authorize" button;
+    # disable in production where clients only use the JSON /login endpoint
+    ENABLE_SWAGGER_TOKEN: bool = True
 
     # LOGFIRE
     LOGFIRE_TOKEN: Optional[str] = None
@@ -25,22 +30,30 @@ class Settings(BaseSettings):
     FLUTTERWAVE_PUBLIC_KEY: Optional[str] = "Kenneth-TEST-1234567"
 
     # SUPABASE
-    SUPABASE_URL: str = os.getenv("SUPABASE_URL")
-    SUPABASE_PUBLISHABLE_KEY: str = os.getenv("SUPABASE_PUBLISHABLE_KEY")
-    SUPABASE_SECRET_KEY: str = os.getenv("SUPABASE_SECRET_KEY")
-    SUPABASE_STORAGE_BUCKET_URL: str = os.getenv("SUPABASE_STORAGE_BUCKET_URL")
+    # Required: read from the environment / .env by field name
+    SUPABASE_URL: str
+    SUPABASE_PUBLISHABLE_KEY: str
+    SUPABASE_SECRET_KEY: str
+    SUPABASE_STORAGE_BUCKET_URL: str
+    # Legacy HS256 JWT secret; when set, access tokens are verified locally
+    SUPABASE_JWT_SECRET: Optional[str] = None
 
     # REDIS
     REDIS_URL: str = "redis://localhost:6379/0"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process; safe to use as a FastAPI dependency."""
+    return Settings()
 
-# Redis initialization
-redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+
+settings = get_settings()
@@ -2,6 +2,13 @@ import structlog
 import logging
 import sys
 
+from app.config.config import settings
+
+if settings.LOG_LEVEL:
+    LOG_LEVEL = logging.getLevelName(settings.LOG_LEVEL.upper())
+else:
+    LOG_LEVEL = logging.DEBUG if settings.DEBUG else logging.INFO
+
 structlog.configure(
     processors=[
         structlog.processors.add_log_level,
@@ -10,9 +17,12 @@ structlog.configure(
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.JSONRenderer(),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+    # Filtered-out levels are bound to no-op methods, so the processor chain
+    # never runs for them
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
     context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
+    # Writes the rendered line directly instead of going through print()
+    logger_factory=structlog.WriteLoggerFactory(file=sys.stdout),
     cache_logger_on_first_use=True,
 )
 
@@ -0,0 +1,37 @@
+from typing import Optional
+from redis import asyncio as aioredis
+
+from app.config.config import settings
+
+# Created in the app lifespan so the pool belongs to the server's event loop;
+# created lazily on first use anywhere else (scripts, tests, the RQ worker).
+_redis: Optional[aioredis.Redis] = None
+
+
+def create_redis_client() -> aioredis.Redis:
+    """Create a pooled async Redis client. No connection is opened until first use."""
+    return aioredis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=50,
+        health_check_interval=30,
+    )
+
+
+def init_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = create_redis_client()
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared async Redis client, creating it on first use."""
+    return _redis if _redis is not None else init_redis()
@@ -1,48 +1,92 @@
-from typing import AsyncGenerator
+from typing import Optional
+
+import httpx
 from supabase import AsyncClient, acreate_client, AsyncClientOptions
 
 
 from app.config.config import settings
 
+# One HTTP connection pool per process, opened in the app lifespan (or lazily
+# on first use, e.g. inside the RQ worker). Clients are not shared: every
+# request gets a new Supabase client object from the public `acreate_client`,
+# built over this pool, so headers, auth sessions and PostgREST/Storage
+# sub-clients stay per request while TCP/TLS connections are reused.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# One pool for GoTrue, PostgREST and Storage across both roles. With an
+# injected httpx client the postgrest/storage timeout options are ignored, so
+# timeouts live here: short connects, longer reads/writes for Storage uploads.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=30
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0, read=30.0, write=30.0)
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+        )
+    return _http_client
+
+
+def _client_options() -> AsyncClientOptions:
+    """Options for a new client: the shared connection pool, no stored sessions."""
+    return AsyncClientOptions(
+        httpx_client=_shared_http_client(),
+        persist_session=False,
+        auto_refresh_token=False,
+    )
+
 
 async def create_supabase_client() -> AsyncClient:
-    """Create a standard Supabase client (anon key).
+    """Create a new standard Supabase client (anon key) over the shared pool.
 
     This is suitable for most user-facing operations and respects RLS.
     """
     supabase: AsyncClient = await acreate_client(
         settings.SUPABASE_URL,
         settings.SUPABASE_PUBLISHABLE_KEY,
-        # options=AsyncClientOptions(
-        #     storage=settings.SUPABASE_STORAGE_BUCKET_URL,
-        # ),
+        options=_client_options(),
     )
     return supabase
 
 
 async def create_supabase_admin_client() -> AsyncClient:
-    """Create an admin Supabase client (service role key).
+    """Create a new admin Supabase client (service role key) over the shared pool.
 
     Use this only where necessary (e.g., privileged admin ops).
     """
     supabase: AsyncClient = await acreate_client(
         settings.SUPABASE_URL,
         settings.SUPABASE_SECRET_KEY,
+        options=_client_options(),
     )
     return supabase
 
 
-async def get_supabase_client() -> AsyncGenerator[AsyncClient, None]:
-    """FastAPI dependency that yields a Supabase client.
+async def init_supabase_clients() -> None:
+    """Open the shared HTTP pool (idempotent)."""
+    _shared_http_client()
 
-    NOTE: For now we do not explicitly close the client. If connection
-    management becomes an issue, we can add explicit cleanup here.
-    """
-    supabase = await create_supabase_client()
-    yield supabase
+
+async def close_supabase_clients() -> None:
+    """Close the HTTP pool shared by all clients."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+
+
+async def get_supabase_client() -> AsyncClient:
+    """FastAPI dependency: a new Supabase client for this request."""
+    return await create_supabase_client()
 
 
-async def get_supabase_admin_client() -> AsyncGenerator[AsyncClient, None]:
-    """FastAPI dependency that yields an admin Supabase client."""
-    supabase = await create_supabase_admin_client()
-    yield supabase
+async def get_supabase_admin_client() -> AsyncClient:
+    """FastAPI dependency: a new admin Supabase client for this request."""
+    return await create_supabase_admin_client()
@@ -1,27 +1,99 @@
+import asyncio
+import jwt
+from datetime import datetime, timezone
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.database.supabase import get_supabase_client
 from app.schemas.user_schemas import UserType
+from app.config.config import settings
+from app.utils.token_cache import token_cache
+from app.dependencies.auth_cache import get_or_load_profile
 from supabase import AsyncClient
+from supabase_auth.types import User
 from app.config.logging import logger
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+ADMIN_ROLES = frozenset(
+    {
+        UserType.ADMIN.value,
+        UserType.SUPER_ADMIN.value,
+        UserType.MODERATOR.value,
+    }
+)
+
+
+def _decode_token_locally(token: str) -> Optional[dict]:
+    """Verify an HS256 access token with the project JWT secret, if configured.
+
+    Returns the claims, or None when local verification is unavailable or fails
+    (the caller then falls back to GoTrue).
+    """
+    if not settings.SUPABASE_JWT_SECRET:
+        return None
+    try:
+        return jwt.decode(
+            token,
+            settings.SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience="authenticated",
+        )
+    except jwt.PyJWTError:
+        return None
+
+
+def _user_from_claims(claims: dict) -> User:
+    # Access tokens carry no account creation time; `iat` stands in for it.
+    return User(
+        id=claims["sub"],
+        aud=claims.get("aud", "authenticated"),
+        role=claims.get("role"),
+        email=claims.get("email"),
+        phone=claims.get("phone"),
+        app_metadata=claims.get("app_metadata", {}),
+        user_metadata=claims.get("user_metadata", {}),
+        created_at=datetime.fromtimestamp(claims.get("iat", 0), tz=timezone.utc),
+    )
+
+
+def _unverified_claims(token: str) -> dict:
+    """Read the claims without checking the signature (cache expiry, prefetch only)."""
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return {}
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     supabase_client: AsyncClient = Depends(get_supabase_client),
 ) -> dict:
+    cached_user = token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     try:
+        claims = _decode_token_locally(token)
+        if claims:
+            user = _user_from_claims(claims)
+            token_cache.set(token, user, exp=claims.get("exp"))
+            logger.debug("user_authenticated", user_id=user.id, source="local_jwt")
+            return user
+
         response = await supabase_client.auth.get_user(token)
         if not response.user:
+            token_cache.evict(token)
             logger.warning("authentication_failed", reason="invalid_or_expired_token")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
             )
 
+        token_cache.set(
+            token, response.user, exp=_unverified_claims(token).get("exp")
+        )
         logger.debug("user_authenticated", user_id=response.user.id)
         return response.user
     except HTTPException:
@@ -34,23 +106,65 @@ async def get_current_user(
         )
 
 
-async def get_current_profile(
+async def get_authenticated_client(
     token: str = Depends(oauth2_scheme),
-    current_user: dict = Depends(get_current_user),
     supabase_client: AsyncClient = Depends(get_supabase_client),
-) -> dict:
-    # Authenticate the client with the user's token so RLS policies work
+) -> AsyncClient:
+    """
+    Auth gate for routes that need a signed-in caller but not their profile.
+    Verifies the token (locally or from the token cache when possible) and
+    returns the request's client authenticated as that user, skipping the
+    `profiles` read done by `get_current_profile`.
+    """
+    await get_current_user(token, supabase_client)
     supabase_client.postgrest.auth(token)
+    return supabase_client
 
-    # Validated: Use standard select and check list length to safely handle missing profiles
-    resp = (
+
+async def _fetch_profile(supabase_client: AsyncClient, user_id: str):
+    # maybe_single() resolves to None (not a 406) when the row is missing
+    return (
         await supabase_client.table("profiles")
         .select("*")
-        .eq("id", current_user.id)
+        .eq("id", user_id)
+        .maybe_single()
         .execute()
     )
 
-    if not resp.data or len(resp.data) == 0:
+
+async def get_current_profile(
+    token: str = Depends(oauth2_scheme),
+    supabase_client: AsyncClient = Depends(get_supabase_client),
+) -> dict:
+    # Authenticate the client with the user's token so RLS policies work
+    supabase_client.postgrest.auth(token)
+
+    current_user = token_cache.get(token)
+    if current_user is not None:
+        resp = await _fetch_profile(supabase_client, current_user.id)
+    else:
+        # Cold token: verify it and fetch the profile in parallel, keyed by the
+        # unverified `sub`. PostgREST checks the JWT itself, and the result is
+        # only used once get_current_user has accepted the token.
+        token_sub = _unverified_claims(token).get("sub")
+        if token_sub:
+            current_user, resp = await asyncio.gather(
+                get_current_user(token, supabase_client),
+                _fetch_profile(supabase_client, token_sub),
+                return_exceptions=True,
+            )
+            # Authentication errors win over whatever the prefetch hit
+            if isinstance(current_user, BaseException):
+                raise current_user
+            if isinstance(resp, BaseException):
+                raise resp
+            if current_user.id != token_sub:
+                resp = await _fetch_profile(supabase_client, current_user.id)
+        else:
+            current_user = await get_current_user(token, supabase_client)
+            resp = await _fetch_profile(supabase_client, current_user.id)
+
+    if resp is None or not resp.data:
         logger.warning("profile_not_found", user_id=current_user.id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found."
@@ -59,25 +173,61 @@ async def get_current_profile(
     logger.debug(
         "profile_retrieved",
         user_id=current_user.id,
-        user_type=resp.data[0].get("user_type"),
+        user_type=resp.data.get("user_type"),
     )
-    return resp.data[0]
+    return resp.data
+
+
+async def get_current_profile_cached(
+    token: str = Depends(oauth2_scheme),
+    supabase_client: AsyncClient = Depends(get_supabase_client),
+) -> dict:
+    """
+    Like `get_current_profile`, but served from a short-TTL profile cache.
+    Meant for role gates (e.g. the admin router) where a profile up to
+    PROFILE_CACHE_TTL seconds old is acceptable; writes that change a role
+    or block a user invalidate the entry.
+    """
+    current_user = await get_current_user(token, supabase_client)
+
+    async def _load() -> Optional[dict]:
+        supabase_client.postgrest.auth(token)
+        resp = await _fetch_profile(supabase_client, current_user.id)
+        return resp.data if resp is not None else None
+
+    profile = await get_or_load_profile(current_user.id, _load)
+    if not profile:
+        logger.warning("profile_not_found", user_id=current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found."
+        )
+    return profile
 
 
 def require_user_type(allowed_types: list[UserType]):
+    # Same types -> same callable, so FastAPI's per-request dependency cache
+    # runs the check once even when several sub-dependencies ask for it
+    return _user_type_guard(tuple(allowed_types))
+
+
+@lru_cache(maxsize=None)
+def _user_type_guard(allowed_types: tuple[UserType, ...]):
+    # Resolved once per guard, not per request
+    allowed_values = frozenset(t.value for t in allowed_types)
+    allowed_repr = [t.value for t in allowed_types]
+
     async def _require_type(profile: dict = Depends(get_current_profile)):
         user_type = profile.get("user_type")
-        allowed_values = [t.value for t in allowed_types]
         if user_type not in allowed_values:
             logger.warning(
                 "access_denied",
                 user_id=profile.get("id"),
                 user_type=user_type,
-                required_types=allowed_values,
+                required_types=allowed_repr,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access restricted to {allowed_values}",
+                detail=f"Access restricted to {allowed_repr}",
             )
         return profile
 
@@ -90,10 +240,12 @@ async def require_authenticated_user(profile: dict = Depends(get_current_profile
 
 async def get_customer_contact_info(
     current_profile: dict = Depends(get_current_profile),
-    supabase_client: AsyncClient = Depends(get_supabase_client),
 ) -> Dict[str, Any]:
     """
-    Dependency to fetch authenticated user's contact info for payment SDK.
+    Dependency to expose the authenticated user's contact info for payment SDK.
+
+    Built straight from the profile row already loaded by
+    `get_current_profile` - no extra query.
 
     Returns:
         {
@@ -101,45 +253,41 @@ async def get_customer_contact_info(
             "phone_number": str,
             "name": str
         }
-
-    Raises:
-        500 if profile fetch fails
-        404 if profile not found
     """
-    try:
-        profile_resp = (
-            await supabase_client.table("profiles")
-            .select("email, phone_number, full_name, business_name")
-            .eq("id", current_profile.get("id"))
-            .single()
-            .execute()
-        )
+    return {
+        "email": current_profile.get("email"),
+        "phone_number": current_profile.get("phone_number", ""),
+        "full_name": current_profile.get("full_name")
+        if current_profile.get("full_name")
+        else current_profile.get("business_name", ""),
+    }
 
-        if not profile_resp.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found"
-            )
 
-        profile = profile_resp.data
+async def require_admin_from_jwt(token: str = Depends(oauth2_scheme)) -> None:
+    """
+    Fast pre-check for admin-only routers.
 
-        return {
-            "email": current_profile.get("email"),
-            "phone_number": profile.get("phone_number", ""),
-            "full_name": profile.get("full_name")
-            if profile.get("full_name")
-            else profile.get("business_name", ""),
-        }
+    When the token can be verified locally and carries a server-controlled
+    `app_metadata.user_type` claim, non-admins are rejected before any
+    GoTrue or `profiles` round trip. Tokens without the claim fall through
+    to the regular profile-based role check.
+    """
+    claims = _decode_token_locally(token)
+    if not claims:
+        return
 
-    except Exception as e:
+    claimed_type = (claims.get("app_metadata") or {}).get("user_type")
+    if claimed_type and claimed_type not in ADMIN_ROLES:
+        logger.warning(
+            "admin_access_denied",
+            user_id=claims.get("sub"),
+            user_type=claimed_type,
+            source="jwt_claims",
+        )
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch user contact info: {str(e)}",
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
         )
 
 
-def is_admin_user(current_profile: dict = Depends(get_current_profile)) -> bool:
-    return current_profile.get("user_type") in [
-        UserType.ADMIN.value,
-        UserType.SUPER_ADMIN.value,
-        UserType.MODERATOR.value,
-    ]
+async def is_admin_user(current_profile: dict = Depends(get_current_profile)) -> bool:
+    return current_profile.get("user_type") in ADMIN_ROLES
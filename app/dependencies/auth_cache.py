@@ -0,0 +1,75 @@
+import asyncio
+import json
+from typing import Awaitable, Callable, Optional
+
+from app.config.logging import logger
+from app.database.redis import get_redis
+from app.utils.token_cache import ValidTokenCache
+
+# Short-lived cache of `profiles` rows for role checks (cache-aside).
+# Redis is shared across workers; the in-process cache only steps in when
+# Redis is unreachable.
+PROFILE_CACHE_TTL = 45
+
+_local_profiles = ValidTokenCache(maxsize=1_000, ttl=PROFILE_CACHE_TTL)
+_load_locks: dict[str, asyncio.Lock] = {}
+
+
+def _profile_key(user_id: str) -> str:
+    return f"v1:profile:{user_id}"
+
+
+async def _get(user_id: str) -> Optional[dict]:
+    try:
+        cached = await get_redis().get(_profile_key(user_id))
+    except Exception as e:
+        logger.warning("profile_cache_unavailable", error=str(e))
+        return _local_profiles.get(user_id)
+    return json.loads(cached) if cached else None
+
+
+async def _set(user_id: str, profile: dict) -> None:
+    _local_profiles.set(user_id, profile)
+    try:
+        await get_redis().set(
+            _profile_key(user_id),
+            json.dumps(profile, default=str),
+            ex=PROFILE_CACHE_TTL,
+        )
+    except Exception as e:
+        logger.warning("profile_cache_unavailable", error=str(e))
+
+
+async def get_or_load_profile(
+    user_id: str, loader: Callable[[], Awaitable[Optional[dict]]]
+) -> Optional[dict]:
+    """
+    Return the cached profile for `user_id`, calling `loader` on a miss.
+    Concurrent misses for the same user share one load.
+    """
+    profile = await _get(user_id)
+    if profile is not None:
+        return profile
+
+    lock = _load_locks.setdefault(user_id, asyncio.Lock())
+    try:
+        async with lock:
+            profile = await _get(user_id)
+            if profile is None:
+                profile = await loader()
+                if profile:
+                    await _set(user_id, profile)
+    finally:
+        if not lock.locked():
+            _load_locks.pop(user_id, None)
+
+    return profile
+
+
+async def invalidate_profile(user_id: str) -> None:
+    """Drop a cached profile after it changes (role, block, verification)."""
+    _local_profiles.evict(user_id)
+    try:
+        await get_redis().delete(_profile_key(user_id))
+    except Exception as e:
+        logger.warning("profile_cache_unavailable", error=str(e))
@@ -1,8 +1,10 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.openapi.docs import get_redoc_html
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routes import (
     user_routes,
     payment_route,
@@ -18,18 +20,47 @@ from app.routes import (
     dispute_route,
     escrow_route,
 )
+from app.config.config import settings
 from app.config.logging import logger
-from app.utils.payment import get_all_banks
+from app.middleware.rate_limit import WebhookRateLimitMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+from app.database.supabase import (
+    init_supabase_clients,
+    close_supabase_clients,
+    get_supabase_admin_client,
+)
+from app.database.redis import init_redis, close_redis
+from app.utils.audit import run_audit_writer
+from app.utils.payment import close_flutterwave_client, get_all_banks
 from app.schemas.bank_schema import BankSchema
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     """Handle application lifespan events"""
     # Startup
-    logger.info("Servipal Application Started", version="1.0.0")
+    await init_supabase_clients()
+    init_redis()
+    # Build and cache the OpenAPI schema now rather than on the first /docs hit
+    app.openapi()
+    audit_writer = asyncio.create_task(
+        run_audit_writer(await get_supabase_admin_client())
+    )
+    logger.info(
+        "Servipal Application Started",
+        version="1.0.0",
+        event_loop=type(asyncio.get_running_loop()).__module__,
+    )
     yield
     # Shutdown
+    audit_writer.cancel()
+    try:
+        await audit_writer
+    except asyncio.CancelledError:
+        pass
+    await close_supabase_clients()
+    await close_redis()
+    await close_flutterwave_client()
     logger.info("Servipal Application Shutdown")
 
 
@@ -39,8 +70,9 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     # docs_url=None,
-    # redoc_url=None,
-    debug=True,
+    # Served by the custom /redoc route below
+    redoc_url=None,
+    debug=settings.DEBUG,
     contact={
         "name": "ServiPal",
         "url": "https://servi-pal.com",
@@ -61,46 +93,16 @@ app.add_middleware(
 )
 
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests"""
-    import time
+# Compress larger JSON bodies (admin list pages run to hundreds of KB)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-    start_time = time.time()
 
-    logger.info(
-        "request_started",
-        method=request.method,
-        path=request.url.path,
-        client_ip=request.client.host if request.client else None,
-        user_agent=request.headers.get("user-agent"),
-    )
+# Throttle the public payment webhook before it reaches the handler
+app.add_middleware(WebhookRateLimitMiddleware, path="/api/v1/payment/webhook")
 
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-
-        logger.info(
-            "request_completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            process_time=round(process_time, 3),
-        )
-
-        return response
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(
-            "request_failed",
-            method=request.method,
-            path=request.url.path,
-            error=str(e),
-            process_time=round(process_time, 3),
-            exc_info=True,
-        )
-        raise
+
+# Request logging middleware
+app.add_middleware(RequestLoggingMiddleware)
 
 
 @app.get("/", tags=["Root"])
@@ -151,16 +153,21 @@ async def get_banks():
 
 
 # Include Routers
-app.include_router(auth_router.router)
-app.include_router(user_routes.router)
-app.include_router(wallet_route.router, include_in_schema=False)
-app.include_router(payment_route.router)
-app.include_router(delivery_route.router)
-app.include_router(notification_router.router)
-app.include_router(review_router.router)
-app.include_router(food_router.router)
-app.include_router(laundry_route.router)
-app.include_router(product_route.router)
-app.include_router(dispute_route.router)
-app.include_router(escrow_route.router)
-app.include_router(admin_router.router, include_in_schema=False)
+ROUTERS = [
+    (auth_router.router, {}),
+    (user_routes.router, {}),
+    (wallet_route.router, {"include_in_schema": False}),
+    (payment_route.router, {}),
+    (delivery_route.router, {}),
+    (notification_router.router, {}),
+    (review_router.router, {}),
+    (food_router.router, {}),
+    (laundry_route.router, {}),
+    (product_route.router, {}),
+    (dispute_route.router, {}),
+    (escrow_route.router, {}),
+    (admin_router.router, {"include_in_schema": False}),
+]
+
+for router, options in ROUTERS:
+    app.include_router(router, **options)
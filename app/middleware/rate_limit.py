@@ -0,0 +1,63 @@
+import hmac
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.config import settings
+from app.config.logging import logger
+from app.utils.redis_utils import take_token
+
+# Tokens per second and bucket size, per client IP. Callers presenting the
+# Flutterwave `verif-hash` get their own, more generous, bucket.
+WEBHOOK_RATE = 20
+WEBHOOK_BURST = 40
+WEBHOOK_SIGNED_RATE = 200
+WEBHOOK_SIGNED_BURST = 400
+
+
+class WebhookRateLimitMiddleware:
+    """
+    Token-bucket limit on a public webhook path as plain ASGI middleware.
+
+    Runs before routing and before the body is read, so throttled callers
+    never reach the handler's signature check or database lookup. Buckets are
+    keyed per client IP; the body-signed `flutterwave-signature` can't be
+    checked this early, so only a matching `verif-hash` header moves a caller
+    to the signed bucket.
+    """
+
+    def __init__(self, app: ASGIApp, path: str):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        headers = dict(scope.get("headers") or [])
+        verif_hash = headers.get(b"verif-hash", b"")
+        secret_hash = (settings.FLW_SECRET_HASH or "").encode()
+        signed = bool(secret_hash) and hmac.compare_digest(verif_hash, secret_hash)
+
+        if signed:
+            allowed = await take_token(
+                f"webhook:signed:{client_ip}", WEBHOOK_SIGNED_RATE, WEBHOOK_SIGNED_BURST
+            )
+        else:
+            allowed = await take_token(
+                f"webhook:{client_ip}", WEBHOOK_RATE, WEBHOOK_BURST
+            )
+
+        if not allowed:
+            logger.warning("webhook_rate_limited", client_ip=client_ip, signed=signed)
+            response = JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
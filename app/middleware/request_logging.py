@@ -0,0 +1,67 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.config import settings
+from app.config.logging import logger
+
+
+class RequestLoggingMiddleware:
+    """
+    Log every HTTP request as plain ASGI middleware.
+
+    Unlike `@app.middleware("http")` (Starlette's BaseHTTPMiddleware) this does
+    not spin up a task group and memory streams per request; it only wraps
+    `send` to capture the response status.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+
+        # uvicorn's access log already records arrivals; only repeat it when debugging
+        if settings.DEBUG:
+            client = scope.get("client")
+            headers = dict(scope.get("headers") or [])
+            logger.info(
+                "request_started",
+                method=method,
+                path=path,
+                client_ip=client[0] if client else None,
+                user_agent=headers.get(b"user-agent", b"").decode("latin-1") or None,
+            )
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(
+                "request_failed",
+                method=method,
+                path=path,
+                error=str(e),
+                process_time=round(time.perf_counter() - start_time, 3),
+                exc_info=True,
+            )
+            raise
+
+        logger.info(
+            "request_completed",
+            method=method,
+            path=path,
+            status_code=status_code,
+            process_time=round(time.perf_counter() - start_time, 3),
+        )
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, Query, Request, HTTPException, status
+import hashlib
+import inspect
+from fastapi import APIRouter, Depends, Query, Request, Response, HTTPException, status
+from pydantic import BaseModel
 from app.services import admin_service
 from app.schemas.admin_schemas import *
-from app.dependencies.auth import get_current_profile
+from app.dependencies.auth import (
+    get_current_profile_cached,
+    require_admin_from_jwt,
+    ADMIN_ROLES,
+)
 from app.database.supabase import get_supabase_admin_client
 from app.schemas.user_schemas import UserType
 from app.config.logging import logger
@@ -9,24 +16,38 @@ from supabase import AsyncClient
 from uuid import UUID
 from datetime import datetime
 
-router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_from_jwt)],
+)
+
+
+def _query_params(model: type[BaseModel]):
+    """
+    Async dependency that builds `model` from the query string.
+
+    `Depends(model)` would work too, but FastAPI runs sync callables (a class
+    included) in the threadpool on every request.
+    """
+
+    async def build(**params):
+        return model(**params)
+
+    build.__signature__ = inspect.signature(model)
+    return build
 
 
 # Helper dependency for admin role check - requires ADMIN, MODERATOR, or SUPER_ADMIN
-async def require_admin_role(profile: dict = Depends(get_current_profile)):
+async def require_admin_role(profile: dict = Depends(get_current_profile_cached)):
     """Require admin, moderator, or superadmin role"""
-    allowed_roles = [
-        UserType.ADMIN.value,
-        UserType.MODERATOR.value,
-        UserType.SUPER_ADMIN.value,
-    ]
     user_type = profile.get("user_type")
-    if user_type not in allowed_roles:
+    if user_type not in ADMIN_ROLES:
         logger.warning(
             "admin_access_denied",
             user_id=profile.get("id"),
             user_type=profile.get("user_type"),
-            required_roles=allowed_roles,
+            required_roles=sorted(ADMIN_ROLES),
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
@@ -36,6 +57,31 @@ async def require_admin_role(profile: dict = Depends(get_current_profile)):
 
 require_admin = require_admin_role
 
+# Offset paging scans and discards every skipped row; past this, use a cursor
+MAX_OFFSET_ROWS = 1000
+
+
+def _check_offset_depth(page: int, page_size: int, after: Optional[str]) -> None:
+    if not after and page * page_size > MAX_OFFSET_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Page too deep; continue with the `after` cursor",
+        )
+
+
+def _with_etag(request: Request, response: Response, payload: BaseModel):
+    """
+    Tag a list payload with a weak ETag over its content and answer a matching
+    If-None-Match with an empty 304, so polling dashboards skip the body.
+    """
+    digest = hashlib.blake2b(payload.model_dump_json().encode(), digest_size=8)
+    etag = f'W/"{digest.hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=10"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return payload
+
 # ========================
 # USER MANAGEMENT ENDPOINTS
 # ========================
@@ -50,10 +96,15 @@ async def list_users(
     is_blocked: Optional[bool] = Query(None, description="Filter by blocked status"),
     account_status: Optional[str] = Query(None, description="Filter by account status"),
     search: Optional[str] = Query(None, description="Search in name, email, phone"),
-    created_from: Optional[str] = Query(
+    created_from: Optional[datetime] = Query(
         None, description="Filter from date (ISO format)"
     ),
-    created_to: Optional[str] = Query(None, description="Filter to date (ISO format)"),
+    created_to: Optional[datetime] = Query(
+        None, description="Filter to date (ISO format)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Opaque cursor (next_cursor of the previous page)"
+    ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_profile: dict = Depends(require_admin),
@@ -70,25 +121,31 @@ async def list_users(
         search (str, optional): Search term.
         created_from (str, optional): Start date.
         created_to (str, optional): End date.
+        after (str, optional): Cursor for keyset paging; takes precedence
+            over `page`, which is limited to the first MAX_OFFSET_ROWS rows.
 
     Returns:
         UsersListResponse: List of users.
     """
     logger.info("admin_list_users", admin_id=current_profile["id"])
 
+    _check_offset_depth(page, page_size, after)
+
     filters = UserFilterParams(
         user_type=user_type,
         is_verified=is_verified,
         is_blocked=is_blocked,
         account_status=account_status,
         search=search,
-        created_from=datetime.fromisoformat(created_from) if created_from else None,
-        created_to=datetime.fromisoformat(created_to) if created_to else None,
+        created_from=created_from,
+        created_to=created_to,
     )
 
     pagination = PaginationParams(page=page, page_size=page_size)
 
-    return await admin_service.list_users(filters, pagination, admin_client)
+    return await admin_service.list_users(
+        filters, pagination, admin_client, after=after
+    )
 
 
 @router.get("/users/{user_id}", response_model=AdminUserResponse)
@@ -230,10 +287,15 @@ async def list_orders(
     customer_id: Optional[UUID] = Query(None, description="Filter by customer ID"),
     vendor_id: Optional[UUID] = Query(None, description="Filter by vendor ID"),
     rider_id: Optional[UUID] = Query(None, description="Filter by rider ID"),
-    created_from: Optional[str] = Query(
+    created_from: Optional[datetime] = Query(
         None, description="Filter from date (ISO format)"
     ),
-    created_to: Optional[str] = Query(None, description="Filter to date (ISO format)"),
+    created_to: Optional[datetime] = Query(
+        None, description="Filter to date (ISO format)"
+    ),
+    after: Optional[str] = Query(
+        None, description="Opaque cursor (next_cursor of the previous page)"
+    ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_profile: dict = Depends(require_admin),
@@ -249,12 +311,16 @@ async def list_orders(
         customer_id (UUID, optional): Filter by customer.
         vendor_id (UUID, optional): Filter by vendor.
         rider_id (UUID, optional): Filter by rider.
+        after (str, optional): Cursor for keyset paging; takes precedence
+            over `page`, which is limited to the first MAX_OFFSET_ROWS rows.
 
     Returns:
         OrdersListResponse: List of orders.
     """
     logger.info("admin_list_orders", admin_id=current_profile["id"])
 
+    _check_offset_depth(page, page_size, after)
+
     filters = OrderFilterParams(
         order_type=order_type,
         status=status,
@@ -262,13 +328,15 @@ async def list_orders(
         customer_id=customer_id,
         vendor_id=vendor_id,
         rider_id=rider_id,
-        created_from=datetime.fromisoformat(created_from) if created_from else None,
-        created_to=datetime.fromisoformat(created_to) if created_to else None,
+        created_from=created_from,
+        created_to=created_to,
     )
 
     pagination = PaginationParams(page=page, page_size=page_size)
 
-    return await admin_service.list_orders(filters, pagination, admin_client)
+    return await admin_service.list_orders(
+        filters, pagination, admin_client, after=after
+    )
 
 
 # ========================
@@ -278,18 +346,14 @@ async def list_orders(
 
 @router.get("/transactions", response_model=TransactionsListResponse)
 async def list_transactions(
-    transaction_type: Optional[str] = Query(
-        None, description="Filter by transaction type"
+    request: Request,
+    response: Response,
+    filters: TransactionFilterParams = Depends(
+        _query_params(TransactionFilterParams)
     ),
-    status: Optional[str] = Query(None, description="Filter by status"),
-    from_user_id: Optional[UUID] = Query(None, description="Filter by sender user ID"),
-    to_user_id: Optional[UUID] = Query(None, description="Filter by recipient user ID"),
-    created_from: Optional[str] = Query(
-        None, description="Filter from date (ISO format)"
+    after: Optional[str] = Query(
+        None, description="Opaque cursor (next_cursor of the previous page)"
     ),
-    created_to: Optional[str] = Query(None, description="Filter to date (ISO format)"),
-    min_amount: Optional[float] = Query(None, description="Minimum amount"),
-    max_amount: Optional[float] = Query(None, description="Maximum amount"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_profile: dict = Depends(require_admin),
@@ -299,34 +363,24 @@ async def list_transactions(
     List all transactions with filtering and pagination.
 
     Args:
-        transaction_type (str, optional): Filter by type.
-        status (str, optional): Filter by status.
-        from_user_id (UUID, optional): Filter by sender.
-        to_user_id (UUID, optional): Filter by recipient.
-        min_amount (float, optional): Min amount.
-        max_amount (float, optional): Max amount.
+        filters (TransactionFilterParams): Type, status, sender/recipient,
+            date range and amount range, parsed from the query string.
+        after (str, optional): Cursor for keyset paging; takes precedence
+            over `page`, which is limited to the first MAX_OFFSET_ROWS rows.
 
     Returns:
         TransactionsListResponse: List of transactions.
     """
     logger.info("admin_list_transactions", admin_id=current_profile["id"])
 
-    from decimal import Decimal
-
-    filters = TransactionFilterParams(
-        transaction_type=transaction_type,
-        status=status,
-        from_user_id=from_user_id,
-        to_user_id=to_user_id,
-        created_from=datetime.fromisoformat(created_from) if created_from else None,
-        created_to=datetime.fromisoformat(created_to) if created_to else None,
-        min_amount=Decimal(str(min_amount)) if min_amount else None,
-        max_amount=Decimal(str(max_amount)) if max_amount else None,
-    )
+    _check_offset_depth(page, page_size, after)
 
     pagination = PaginationParams(page=page, page_size=page_size)
 
-    return await admin_service.list_transactions(filters, pagination, admin_client)
+    result = await admin_service.list_transactions(
+        filters, pagination, admin_client, after=after
+    )
+    return _with_etag(request, response, result)
 
 
 # ========================
@@ -336,6 +390,8 @@ async def list_transactions(
 
 @router.get("/wallets", response_model=WalletsListResponse)
 async def list_wallets(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_profile: dict = Depends(require_admin),
@@ -351,7 +407,8 @@ async def list_wallets(
 
     pagination = PaginationParams(page=page, page_size=page_size)
 
-    return await admin_service.list_wallets(pagination, admin_client)
+    result = await admin_service.list_wallets(pagination, admin_client)
+    return _with_etag(request, response, result)
 
 
 @router.post("/wallets/adjust", response_model=AdminWalletResponse)
@@ -407,14 +464,9 @@ async def get_dashboard_stats(
 
 @router.get("/audit-logs", response_model=AuditLogsListResponse)
 async def list_audit_logs(
-    entity_type: Optional[str] = Query(None, description="Filter by entity type"),
-    action: Optional[str] = Query(None, description="Filter by action"),
-    actor_id: Optional[UUID] = Query(None, description="Filter by actor ID"),
-    actor_type: Optional[str] = Query(None, description="Filter by actor type"),
-    created_from: Optional[str] = Query(
-        None, description="Filter from date (ISO format)"
-    ),
-    created_to: Optional[str] = Query(None, description="Filter to date (ISO format)"),
+    request: Request,
+    response: Response,
+    filters: AuditLogFilterParams = Depends(_query_params(AuditLogFilterParams)),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_profile: dict = Depends(require_admin),
@@ -424,24 +476,15 @@ async def list_audit_logs(
     List audit logs with filtering and pagination.
 
     Args:
-        entity_type (str, optional): Filter by entity.
-        action (str, optional): Filter by action.
-        actor_id (UUID, optional): Filter by actor.
+        filters (AuditLogFilterParams): Entity, action, actor and date range,
+            parsed from the query string.
 
     Returns:
         AuditLogsListResponse: List of logs.
     """
     logger.info("admin_list_audit_logs", admin_id=current_profile["id"])
 
-    filters = AuditLogFilterParams(
-        entity_type=entity_type,
-        action=action,
-        actor_id=actor_id,
-        actor_type=actor_type,
-        created_from=datetime.fromisoformat(created_from) if created_from else None,
-        created_to=datetime.fromisoformat(created_to) if created_to else None,
-    )
-
     pagination = PaginationParams(page=page, page_size=page_size)
 
-    return await admin_service.list_audit_logs(filters, pagination, admin_client)
+    result = await admin_service.list_audit_logs(filters, pagination, admin_client)
+    return _with_etag(request, response, result)
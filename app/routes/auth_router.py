@@ -3,6 +3,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from app.services import user_service
 from app.schemas.user_schemas import UserCreate, LoginRequest, TokenResponse
 from app.database.supabase import get_supabase_client, get_supabase_admin_client
+from app.config.config import settings
 from app.config.logging import logger
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
@@ -46,13 +47,17 @@ async def login(
     return await user_service.login_user(login_data, supabase, request)
 
 
-@router.post("/token", response_model=TokenResponse, include_in_schema=False)
-async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    request: Request = None,
-    supabase=Depends(get_supabase_client),
-):
-    """OAuth2 compatible token endpoint for Swagger UI authentication."""
-    logger.info("token_endpoint_called", username=form_data.username)
-    login_data = LoginRequest(email=form_data.username, password=form_data.password)
-    return await user_service.login_user(login_data, supabase, request)
+if settings.ENABLE_SWAGGER_TOKEN:
+
+    @router.post("/token", response_model=TokenResponse, include_in_schema=False)
+    async def login_for_access_token(
+        request: Request,
+        form_data: OAuth2PasswordRequestForm = Depends(),
+        supabase=Depends(get_supabase_client),
+    ):
+        """OAuth2 compatible token endpoint for Swagger UI authentication."""
+        logger.info("token_endpoint_called", username=form_data.username)
+        login_data = LoginRequest(
+            email=form_data.username, password=form_data.password
+        )
+        return await user_service.login_user(login_data, supabase, request)
@@ -28,6 +28,8 @@ from app.utils.storage import upload_to_supabase_storage
 
 router = APIRouter(tags=["Deliveries"], prefix="/api/v1/delivery")
 
+rider_only = require_user_type([UserType.RIDER])
+
 
 # ───────────────────────────────────────────────
 # 1. Initiate Payment (Create Draft Order + Fee)
@@ -43,7 +45,7 @@ async def initiate_delivery_payment(
     dropoff_lng: float = Form(...),
     additional_info: Optional[str] = Form(...),
     delivery_type: DeliveryType = Form("STANDARD"),
-    package_image: UploadFile = File(...),
+    package_image: Optional[UploadFile] = File(None),
     current_profile: dict = Depends(get_current_profile),
     supabase=Depends(get_supabase_admin_client),
     customer_info: dict = Depends(get_customer_contact_info),
@@ -57,7 +59,7 @@ async def initiate_delivery_payment(
     logger.info("customer_info_received", customer_info=customer_info)
     # Upload image if provided
     url = None
-    if package_image:
+    if package_image is not None and package_image.filename:
         folder = f"deliveries/{uuid.uuid4().hex[:8]}/"
         try:
             url = await upload_to_supabase_storage(
@@ -141,7 +143,7 @@ async def assign_rider(
 async def rider_act_on_delivery(
     delivery_id: UUID,
     action_data: DeliveryAction,
-    current_profile: dict = Depends(require_user_type([UserType.RIDER])),
+    current_profile: dict = Depends(rider_only),
     supabase=Depends(get_supabase_client),
 ):
     """
@@ -165,7 +167,7 @@ async def rider_act_on_delivery(
 @router.post("/{delivery_id}/pickup")
 async def rider_pickup_package(
     delivery_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.RIDER])),
+    current_profile: dict = Depends(rider_only),
     supabase=Depends(get_supabase_client),
 ):
     """
@@ -188,7 +190,7 @@ async def rider_pickup_package(
 @router.post("/{delivery_id}/confirm-delivery")
 async def rider_confirm_delivered(
     delivery_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.RIDER])),
+    current_profile: dict = Depends(rider_only),
     supabase=Depends(get_supabase_client),
 ):
     """
@@ -15,6 +15,10 @@ from app.database.supabase import get_supabase_client
 
 router = APIRouter(prefix="/api/v1/disputes", tags=["Disputes"])
 
+staff_only = require_user_type(
+    [UserType.ADMIN, UserType.MODERATOR, UserType.SUPER_ADMIN]
+)
+
 
 @router.post("/", response_model=DisputeResponse)
 async def create_dispute(
@@ -94,9 +98,7 @@ async def post_dispute_message(
 async def resolve_dispute(
     dispute_id: UUID,
     data: DisputeResolve,
-    current_profile: dict = Depends(
-        require_user_type([UserType.ADMIN, UserType.MODERATOR, UserType.SUPER_ADMIN])
-    ),
+    current_profile: dict = Depends(staff_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
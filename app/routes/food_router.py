@@ -1,17 +1,31 @@
-from fastapi import APIRouter, Depends, Query, Form, File, UploadFile, Request
-from typing import List, Optional
+import asyncio
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    Form,
+    File,
+    UploadFile,
+    Request,
+    Response,
+    status,
+)
+from typing import Any, List, Optional
 from uuid import UUID
 from decimal import Decimal
 from supabase import AsyncClient
-from typing_extensions import Literal
 
+from app.schemas.common import VendorOrderAction
 from app.schemas.food_schemas import (
+    FoodVendorDashboardResponse,
     VendorCardResponse,
     VendorDetailResponse,
+    VendorMenuItemsResponse,
     FoodItemUpdate,
     CheckoutRequest,
 )
 from app.dependencies.auth import (
+    get_authenticated_client,
     get_current_profile,
     require_user_type,
     get_customer_contact_info,
@@ -23,6 +37,8 @@ from app.config.logging import logger
 
 router = APIRouter(prefix="/api/v1/food", tags=["Food"])
 
+restaurant_vendor_only = require_user_type([UserType.RESTAURANT_VENDOR])
+
 
 # ───────────────────────────────────────────────
 # Vendor Browsing
@@ -31,8 +47,7 @@ router = APIRouter(prefix="/api/v1/food", tags=["Food"])
 async def list_food_vendors(
     lat: Optional[float] = Query(None, description="Latitude for nearby search"),
     lng: Optional[float] = Query(None, description="Longitude for nearby search"),
-    supabase: AsyncClient = Depends(get_supabase_client),
-    current_user: dict = Depends(get_current_profile)
+    supabase: AsyncClient = Depends(get_authenticated_client),
 ):
     """
     List restaurant vendors.
@@ -49,10 +64,8 @@ async def list_food_vendors(
 
 @router.get("/vendors/{vendor_id}", response_model=VendorDetailResponse)
 async def get_vendor_menu(
-    vendor_id: UUID, 
-    supabase: AsyncClient = Depends(get_supabase_client),
-    current_user: dict = Depends(get_current_profile)
-
+    vendor_id: UUID,
+    supabase: AsyncClient = Depends(get_authenticated_client),
 ):
     """
     Get vendor details and full menu.
@@ -78,7 +91,7 @@ async def add_menu_item_with_images(
     sizes: Optional[List[str]] = Form([]),
     images: List[UploadFile] = File([]),
     request: Request = None,
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -114,7 +127,7 @@ async def update_menu_item(
     item_id: UUID,
     item_data: FoodItemUpdate,
     request: Request = None,
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -141,7 +154,7 @@ async def update_menu_item(
 async def delete_menu_item(
     item_id: UUID,
     request: Request = None,
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -163,17 +176,36 @@ async def delete_menu_item(
     )
 
 
-@router.get("/menu")
+@router.get("/menu", response_model=VendorMenuItemsResponse)
 async def get_my_menu(
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
-    """Vendor views their own menu items"""
+    """
+    Vendor views their own menu items.
+
+    Tagged with the vendor's menu version, so a matching If-None-Match is
+    answered with a 304 without querying the items.
+    """
+    version = await food_service.get_menu_version(current_profile["id"])
+    if version:
+        etag = f'W/"{current_profile["id"]}-{version}-{limit}-{offset}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
     resp = (
         await supabase.table("food_items")
-        .select("*")
+        .select("id, name, description, price, category_id, sizes, images, in_stock")
         .eq("vendor_id", current_profile["id"])
         .eq("is_deleted", False)
+        .order("name")
+        .range(offset, offset + limit - 1)
         .execute()
     )
     return {"items": resp.data}
@@ -211,9 +243,9 @@ async def initiate_food_payment_endpoint(
 @router.post("/orders/{order_id}/action")
 async def vendor_food_order_action_endpoint(
     order_id: UUID,
-    action_data: Literal["accept", "reject"],
+    action_data: VendorOrderAction,
     request: Request = None,
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -221,19 +253,21 @@ async def vendor_food_order_action_endpoint(
 
     Args:
         order_id (UUID): The order ID.
-        action_data (Literal['accept', 'reject']): The action.
+        action_data (VendorOrderAction): The action (accept/reject).
 
     Returns:
         dict: Action result.
     """
     logger.info(
-        "vendor_food_order_action_endpoint", order_id=str(order_id), action=action_data
+        "vendor_food_order_action_endpoint",
+        order_id=str(order_id),
+        action=action_data.action,
     )
     return await food_service.vendor_food_order_action(
         order_id=order_id,
         vendor_id=current_profile["id"],
         supabase=supabase,
-        action=action_data,
+        action=action_data.action,
         request=request,
     )
 
@@ -241,7 +275,7 @@ async def vendor_food_order_action_endpoint(
 @router.post("/orders/{order_id}/mark-ready")
 async def vendor_mark_ready_endpoint(
     order_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -288,9 +322,11 @@ async def customer_confirm_food_endpoint(
 # ───────────────────────────────────────────────
 # Vendor Earnings (Bonus)
 # ───────────────────────────────────────────────
-@router.get("/earnings")
+# Any still gives the route a response field, so the RPC result is serialised
+# by pydantic-core rather than walked by jsonable_encoder
+@router.get("/earnings", response_model=Any)
 async def vendor_food_earnings(
-    current_profile: dict = Depends(require_user_type([UserType.RESTAURANT_VENDOR])),
+    current_profile: dict = Depends(restaurant_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """Vendor views their earnings dashboard"""
@@ -299,3 +335,24 @@ async def vendor_food_earnings(
         "get_vendor_earnings", {"p_vendor_id": str(current_profile["id"])}
     ).execute()
     return earnings.data
+
+
+@router.get("/dashboard", response_model=FoodVendorDashboardResponse)
+async def vendor_food_dashboard(
+    current_profile: dict = Depends(restaurant_vendor_only),
+    supabase: AsyncClient = Depends(get_supabase_client),
+):
+    """
+    Vendor dashboard in one call: store details with menu, and earnings.
+
+    Returns:
+        FoodVendorDashboardResponse: What `/vendors/{id}` and `/earnings`
+            return, fetched concurrently.
+    """
+    vendor, earnings = await asyncio.gather(
+        food_service.get_vendor_detail(current_profile["id"], supabase),
+        supabase.rpc(
+            "get_vendor_earnings", {"p_vendor_id": str(current_profile["id"])}
+        ).execute(),
+    )
+    return FoodVendorDashboardResponse(vendor=vendor, earnings=earnings.data)
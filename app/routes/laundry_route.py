@@ -6,6 +6,7 @@ from app.schemas.laundry_schemas import (
     LaundryVendorDetailResponse,
     LaundryItemDetailResponse,
     LaundryItemUpdate,
+    LaundryMenuItemsResponse,
     LaundryVendorMarkReadyResponse,
     LaundryCustomerConfirmResponse,
     LaundryOrderCreate,
@@ -22,9 +23,12 @@ from app.schemas.common import (
     VendorOrderActionResponse,
     VendorResponse,
 )
+from app.config.logging import logger
 
 router = APIRouter(prefix="/api/v1/laundry", tags=["Laundry"])
 
+laundry_vendor_only = require_user_type([UserType.LAUNDRY_VENDOR])
+
 
 @router.get("/vendors", response_model=List[VendorResponse])
 async def list_laundry_vendors(
@@ -89,7 +93,7 @@ async def initiate_laundry_payment_endpoint(
 async def vendor_laundry_order_action_endpoint(
     order_id: UUID,
     data: VendorOrderAction,
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -112,7 +116,7 @@ async def vendor_laundry_order_action_endpoint(
 )
 async def vendor_mark_laundry_ready_endpoint(
     order_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -148,8 +152,6 @@ async def customer_confirm_laundry_receipt(
     Returns:
         LaundryCustomerConfirmResponse: Confirmation result.
     """
-    from app.config.logging import logger
-
     logger.info(
         "customer_confirm_laundry_receipt_endpoint",
         order_id=str(order_id),
@@ -160,9 +162,11 @@ async def customer_confirm_laundry_receipt(
     )
 
 
-@router.get("/menu")
+@router.get("/menu", response_model=LaundryMenuItemsResponse)
 async def get_my_laundry_menu(
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -173,9 +177,11 @@ async def get_my_laundry_menu(
     """
     resp = (
         await supabase.table("laundry_items")
-        .select("*")
+        .select("id, name, description, price, stock, in_stock, category_id, images")
         .eq("vendor_id", current_profile["id"])
         .eq("is_deleted", False)
+        .order("name")
+        .range(offset, offset + limit - 1)
         .execute()
     )
     return {"items": resp.data}
@@ -187,7 +193,7 @@ async def add_laundry_item_with_images(
     description: Optional[str] = Form(None),
     price: Decimal = Form(...),
     images: List[UploadFile] = File([]),
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -216,7 +222,7 @@ async def add_laundry_item_with_images(
 async def update_laundry_item_endpoint(
     item_id: UUID,
     data: LaundryItemUpdate,
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
@@ -237,7 +243,7 @@ async def update_laundry_item_endpoint(
 @router.delete("/menu/items/{item_id}")
 async def delete_laundry_item_endpoint(
     item_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.LAUNDRY_VENDOR])),
+    current_profile: dict = Depends(laundry_vendor_only),
     supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """Vendor archives a laundry item"""
@@ -1,6 +1,8 @@
+import asyncio
 from fastapi import APIRouter, Request, Header, HTTPException, Depends, status
 from supabase import AsyncClient
 from app.services.payment_service import (
+    run_payment_job,
     process_successful_delivery_payment,
     process_successful_food_payment,
     process_successful_topup_payment,
@@ -10,10 +12,14 @@ from app.services.payment_service import (
 from app.config.config import settings
 from app.config.logging import logger
 from app.database.supabase import get_supabase_client
+from app.utils.audit import audit_context
 from app.worker import queue
 from rq import Retry
 from pydantic import BaseModel
+import base64
+import hashlib
 import hmac
+import json
 
 class PaymentWebhookResponse(BaseModel):
     status: str
@@ -23,6 +29,36 @@ class PaymentWebhookResponse(BaseModel):
 router = APIRouter(tags=["payment-webhook"], prefix="/api/v1/payment")
 
 
+def _valid_webhook_signature(request: Request, body: bytes) -> bool:
+    """
+    Newer Flutterwave webhooks sign the raw body (`flutterwave-signature`:
+    base64 HMAC-SHA256 keyed with the secret hash); v3 ones just echo the
+    secret hash in `verif-hash`.
+    """
+    secret_hash = settings.FLW_SECRET_HASH
+    if not secret_hash:
+        return False
+
+    signature = request.headers.get("flutterwave-signature")
+    if signature:
+        digest = hmac.new(secret_hash.encode(), body, hashlib.sha256).digest()
+        return hmac.compare_digest(base64.b64encode(digest), signature.encode())
+
+    verif_hash = request.headers.get("verif-hash", "")
+    return hmac.compare_digest(verif_hash.encode(), secret_hash.encode())
+
+WEBHOOK_DB_TIMEOUT = 2.0
+
+# tx_ref is "<PREFIX>-..."; the prefix names the order type
+PAYMENT_HANDLERS = {
+    "DEL": process_successful_delivery_payment,
+    "FOOD": process_successful_food_payment,
+    "TOPUP": process_successful_topup_payment,
+    "LAUNDRY": process_successful_laundry_payment,
+    "PRODUCT": process_successful_product_payment,
+}
+
+
 @router.post("/webhook")
 async def flutterwave_webhook(
     request: Request,
@@ -43,32 +79,34 @@ async def flutterwave_webhook(
         - :param request:
         - :param supabase:
     """
-    # 1. Verify webhook signature (Flutterwave sends verif-hash header)
-
-    secret_hash = settings.FLW_SECRET_HASH
-    signature = request.headers.get("verif-hash")
-    if not hmac.compare_digest(signature, secret_hash):
-        logger.warning(
-            "webhook_signature_invalid",
-            client_ip=request.client.host if request.client else None,
-        )
+    # 1. Verify webhook signature against the raw body
+    body = await request.body()
+    client_ip = request.client.host if request.client else None
+    if not _valid_webhook_signature(request, body):
+        logger.warning("webhook_signature_invalid", client_ip=client_ip)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
 
     # 2. Parse payload
-    payload = await request.json()
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        logger.warning("webhook_payload_invalid", client_ip=client_ip)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid webhook payload")
     event = payload.get("event")
     data = payload.get("data", {})
 
     logger.info(
         "webhook_received",
-        event=event,
+        webhook_event=event,
         status=data.get("status"),
         tx_ref=data.get("tx_ref"),
     )
 
     # 3. Only process successful charge events
     if event != "charge.completed" or data.get("status") != "successful":
-        logger.debug("webhook_event_ignored", event=event, status=data.get("status"))
+        logger.debug("webhook_event_ignored", webhook_event=event, status=data.get("status"))
         return {"status": "ignored", "message": "Event not charge.completed or not successful"}
 
     tx_ref = data.get("tx_ref")
@@ -79,38 +117,37 @@ async def flutterwave_webhook(
         logger.warning("webhook_missing_tx_ref", payload=payload)
         return {"status": "error", "message": "Missing tx_ref"}
 
-    # 4. Idempotency check (prevent double-processing)
-    existing = (
-        await supabase.table("transactions").select("id").eq("tx_ref", tx_ref).execute()
-    )
+    # 4. Pick the handler from the tx_ref prefix before any
+    # database work so unknown references are dropped cheaply
+    handler = PAYMENT_HANDLERS.get(tx_ref.split("-", 1)[0])
+    if not handler:
+        return {"status": "unknown_transaction_type"}
+
+    # 5. Idempotency check (prevent double-processing). If the database is slow,
+    # queue anyway: jobs only act on payments still pending in Redis.
+    try:
+        existing = await asyncio.wait_for(
+            supabase.table("transactions").select("id").eq("tx_ref", tx_ref).execute(),
+            timeout=WEBHOOK_DB_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("webhook_idempotency_check_timeout", tx_ref=tx_ref)
+        existing = None
 
-    if existing.data:
+    if existing is not None and existing.data:
         logger.info("webhook_already_processed", tx_ref=tx_ref)
         return {"status": "already_processed", "message": "Transaction already processed", "tx_ref": tx_ref}
 
-    # 5. Determine which handler is based on the tx_ref prefix
-    handler = None
-    if tx_ref.startswith("DEL-"):
-        handler = process_successful_delivery_payment
-    elif tx_ref.startswith("FOOD-"):
-        handler = process_successful_food_payment
-    elif tx_ref.startswith("TOPUP-"):
-        handler = process_successful_topup_payment
-    elif tx_ref.startswith("LAUNDRY-"):
-        handler = process_successful_laundry_payment
-    elif tx_ref.startswith("PRODUCT-"):
-        handler = process_successful_product_payment
-
-    if not handler:
-        return {"status": "unknown_transaction_type"}
-
-    # 6. Queue the job with retry (5 attempts, exponential backoff)
-    queue.enqueue(
+    # 6. Queue the job with retry (5 attempts, exponential backoff).
+    # RQ talks to Redis synchronously, so keep it off the event loop.
+    await asyncio.to_thread(
+        queue.enqueue,
+        run_payment_job,
         handler,
         tx_ref,
         paid_amount,
         flw_ref,
-        request,  # Pass request for audit logging
+        audit_context(request),  # Request itself can't be pickled
         retry=Retry(
             max=5, interval=[30, 60, 120, 300, 600]
         ),  # 30s → 1min → 2min → 5min → 10min
@@ -1,4 +1,17 @@
-from fastapi import APIRouter, Depends, Form, File, UploadFile
+import asyncio
+import hashlib
+import json
+from fastapi import (
+    APIRouter,
+    Depends,
+    Form,
+    File,
+    UploadFile,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from typing import List, Optional
 from decimal import Decimal
 from uuid import UUID
@@ -25,6 +38,12 @@ from app.utils.storage import upload_to_supabase_storage
 
 router = APIRouter(prefix="/api/v1/product", tags=["Marketplace"])
 
+seller_only = require_user_type(
+    [UserType.CUSTOMER, UserType.RESTAURANT_VENDOR, UserType.LAUNDRY_VENDOR]
+)
+
+MAX_PRODUCT_IMAGES = 5
+
 
 # ───────────────────────────────────────────────
 # Product Items CRUD (any authenticated user)
@@ -64,17 +83,26 @@ async def create_product_item(
     parsed_sizes = [s.strip() for s in sizes.split(",")] if sizes else []
     parsed_colors = [c.strip() for c in colors.split(",")] if colors else []
 
+    if len(images) > MAX_PRODUCT_IMAGES:
+        raise HTTPException(400, f"At most {MAX_PRODUCT_IMAGES} images per product")
+
     uploaded_images = []
     if images:
         product_folder = f"products/{uuid.uuid4().hex}"
-        for file in images:
-            url = await upload_to_supabase_storage(
-                file=file,
-                supabase=supabase,
-                bucket="product-images",
-                folder=product_folder,
+        # Each upload streams its file; run them side by side, order preserved
+        uploaded_images = list(
+            await asyncio.gather(
+                *(
+                    upload_to_supabase_storage(
+                        file=file,
+                        supabase=supabase,
+                        bucket="product-images",
+                        folder=product_folder,
+                    )
+                    for file in images
+                )
             )
-            uploaded_images.append(url)
+        )
 
     data = ProductItemCreate(
         name=name,
@@ -97,6 +125,8 @@ async def create_product_item(
 @router.get("/items/{item_id}", response_model=ProductItemResponse)
 async def get_product_item(
     item_id: UUID, 
+    request: Request,
+    response: Response,
     supabase: AsyncClient = Depends(get_supabase_client),
     current_user: dict = Depends(get_current_profile)
 
@@ -104,13 +134,26 @@ async def get_product_item(
     """
     View a single product detail.
 
+    Tagged with a digest of the row, so a matching If-None-Match is answered
+    with a 304 before the item is validated and serialised. Hashing the row
+    also catches stock changes written by order processing.
+
     Args:
         item_id (UUID): The product ID.
 
     Returns:
         ProductItemResponse: Product details.
     """
-    return await product_service.get_product_item(item_id, supabase)
+    item = await product_service.get_product_item_row(item_id, supabase)
+
+    row = json.dumps(item, sort_keys=True, default=str).encode()
+    etag = f'W/"{hashlib.blake2b(row, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    return item
 
 
 @router.get("/my-items", response_model=List[ProductItemResponse])
@@ -204,11 +247,7 @@ async def vendor_product_order_action(
     order_id: UUID,
     data: ProductVendorOrderAction,
     supabase: AsyncClient = Depends(get_supabase_client),
-    current_profile: dict = Depends(
-        require_user_type(
-            [UserType.CUSTOMER, UserType.RESTAURANT_VENDOR, UserType.LAUNDRY_VENDOR]
-        )
-    ),
+    current_profile: dict = Depends(seller_only),
 ):
     """
     Vendor accepts or rejects the product order.
@@ -231,11 +270,7 @@ async def vendor_product_order_action(
 async def vendor_mark_product_ready(
     order_id: UUID,
     supabase: AsyncClient = Depends(get_supabase_client),
-    current_profile: dict = Depends(
-        require_user_type(
-            [UserType.RESTAURANT_VENDOR, UserType.LAUNDRY_VENDOR, UserType.CUSTOMER]
-        )
-    ),
+    current_profile: dict = Depends(seller_only),
 ):
     """
     Vendor marks product order as ready for pickup/delivery.
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response, status
 from uuid import UUID
+from supabase import AsyncClient
 from app.schemas.review_schemas import ReviewCreate, ReviewsListResponse
-from app.services.review_service import create_review, get_reviews_for_entity
+from app.services.review_service import (
+    create_review,
+    get_reviews_for_entity,
+    get_reviews_version,
+)
 from app.dependencies.auth import get_current_profile
+from app.database.supabase import get_supabase_client
 
 router = APIRouter(prefix="/api/v1/reviews", tags=["reviews"])
 
@@ -13,6 +19,7 @@ async def submit_review(
     order_type: str,
     review_data: ReviewCreate,
     current_profile: dict = Depends(get_current_profile),
+    supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
     Submit a review after order completion.
@@ -25,17 +32,25 @@ async def submit_review(
     Returns:
         dict: Created review.
     """
-    return await create_review(order_id, order_type, review_data, current_profile["id"])
+    return await create_review(
+        order_id, order_type, review_data, current_profile["id"], supabase
+    )
 
 
 @router.get("/entity/{entity_id}/{entity_type}", response_model=ReviewsListResponse)
 async def get_entity_reviews(
     entity_id: UUID,
     entity_type: str,  # RIDER, VENDOR, DISPATCH
+    request: Request,
+    response: Response,
+    supabase: AsyncClient = Depends(get_supabase_client),
 ):
     """
     Get all reviews for a specific entity.
 
+    Tagged with the entity's review version, so a matching If-None-Match is
+    answered with a 304 without querying the reviews.
+
     Args:
         entity_id (UUID): The entity ID.
         entity_type (str): Type of entity (RIDER, VENDOR, DISPATCH).
@@ -43,4 +58,12 @@ async def get_entity_reviews(
     Returns:
         ReviewsListResponse: List of reviews.
     """
-    return await get_reviews_for_entity(entity_id, entity_type)
+    version = await get_reviews_version(entity_id, entity_type)
+    if version:
+        etag = f'W/"{entity_type}-{entity_id}-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return await get_reviews_for_entity(entity_id, entity_type, supabase)
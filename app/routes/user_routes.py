@@ -1,14 +1,38 @@
-from fastapi import APIRouter, Depends, Query, File
-from app.services.user_service import *
+from fastapi import APIRouter, Depends, Query, File, Request, UploadFile
 from typing import List, Optional
+from uuid import UUID
 from app.schemas.user_schemas import (
     UserType,
     ProfileUpdate,
     UserLocationUpdate,
     DetailedRiderResponse,
     OnlineStatusResponse,
+    ProfileImageCommitRequest,
+    ProfileImageUploadRequest,
+    ProfileImageUploadResponse,
+    AvailableRiderResponse,
+    DispatchRiderResponse,
+    RiderCreateByDispatch,
+    RiderEarningsResponse,
+    RiderSuspensionRequest,
+    RiderSuspensionResponse,
+    UserProfileResponse,
 )
 from app.services import user_service
+from app.services.user_service import (
+    commit_profile_image,
+    create_profile_image_upload,
+    create_rider_by_dispatch,
+    get_available_riders,
+    get_rider_earnings,
+    get_user_profile,
+    get_vendor_earnings,
+    suspend_or_unsuspend_rider,
+    toggle_online_or_can_pickup,
+    update_user_location,
+    update_user_profile,
+    upload_profile_image,
+)
 from app.dependencies.auth import get_current_profile, require_user_type
 from app.database.supabase import get_supabase_client, get_supabase_admin_client
 from app.config.logging import logger
@@ -16,13 +40,15 @@ from supabase import AsyncClient
 
 router = APIRouter(prefix="/api/v1/users", tags=["Users"])
 
+dispatch_only = require_user_type([UserType.DISPATCH])
+
 
 @router.post("/riders", response_model=UserProfileResponse)
 async def create_rider(
     data: RiderCreateByDispatch,
     request: Request,
     current_user: dict = Depends(get_current_profile),
-    dispatch_user=Depends(require_user_type([UserType.DISPATCH])),
+    dispatch_user=Depends(dispatch_only),
     supabase: AsyncClient = Depends(get_supabase_admin_client),
     
 ):
@@ -35,9 +61,6 @@ async def create_rider(
     Returns:
         UserProfileResponse: The created rider's profile.
     """
-    logger.info(
-        "create_rider_requested", dispatch_id=current_user["id"], rider_phone=data.phone
-    )
     result = await create_rider_by_dispatch(data, current_user, supabase, request)
     logger.info("rider_created", dispatch_id=current_user["id"], rider_id=result.id)
     return result
@@ -74,33 +97,15 @@ async def update_profile(
     Returns:
         UserProfileResponse: Updated profile.
     """
+    result = await update_user_profile(profile["id"], data, supabase, request)
     logger.info(
-        "update_profile_requested",
+        "profile_updated",
         user_id=profile["id"],
         updates=data.model_dump(exclude_unset=True),
     )
-    result = await update_user_profile(profile["id"], data, supabase, request)
-    logger.info("profile_updated", user_id=profile["id"])
     return result
 
 
-@router.get("/my-riders")
-async def get_my_riders(
-    current_profile: dict = Depends(require_user_type([UserType.DISPATCH])),
-    supabase=Depends(get_supabase_client),
-):
-    """
-    Get all riders managed by the current dispatch user (raw RPC call).
-
-    Returns:
-        list: List of riders.
-    """
-    resp = await supabase.rpc(
-        "get_my_riders", {"dispatch_user_id": current_profile["id"]}
-    ).execute()
-    return resp.data
-
-
 @router.get("/available-riders", response_model=List[AvailableRiderResponse])
 async def list_available_riders(
     lat: Optional[float] = Query(None, description="Pickup latitude"),
@@ -118,33 +123,27 @@ async def list_available_riders(
 
 @router.get("/my-riders", response_model=List[DispatchRiderResponse])
 async def get_dispatch_riders(
-    current_profile: dict = Depends(require_user_type([UserType.DISPATCH])),
+    current_profile: dict = Depends(dispatch_only),
     supabase=Depends(get_supabase_client),
 ):
     """
     Dispatch owner gets a list of all their riders
     with performance stats for management
     """
-    return await get_my_riders(current_profile["id"], supabase)
+    return await user_service.get_my_riders(current_profile["id"], supabase)
 
 
 @router.post("/riders/suspend", response_model=RiderSuspensionResponse)
 async def suspend_rider(
     data: RiderSuspensionRequest,
     request: Request,
-    current_profile: dict = Depends(require_user_type([UserType.DISPATCH])),
+    current_profile: dict = Depends(dispatch_only),
     supabase=Depends(get_supabase_admin_client),
 ):
     """
     Dispatch can suspend or unsuspend their riders
     Optional: temporary suspension with end date
     """
-    logger.info(
-        "rider_suspension_requested",
-        dispatch_id=current_profile["id"],
-        rider_id=data.rider_id,
-        suspend=data.suspend,
-    )
     result = await suspend_or_unsuspend_rider(
         data, current_profile["id"], supabase, request
     )
@@ -160,7 +159,7 @@ async def suspend_rider(
 @router.get("/riders/{rider_id}/earnings", response_model=RiderEarningsResponse)
 async def view_rider_earnings(
     rider_id: UUID,
-    current_profile: dict = Depends(require_user_type([UserType.DISPATCH])),
+    current_profile: dict = Depends(dispatch_only),
     supabase=Depends(get_supabase_client),
 ):
     """
@@ -210,11 +209,6 @@ async def upload_profile_pic(
     Returns:
         dict: Success status and image URL.
     """
-    logger.info(
-        "profile_image_upload_requested",
-        user_id=current_profile["id"],
-        image_type="profile",
-    )
     url = await upload_profile_image(
         file, current_profile["id"], "profile", supabase, request
     )
@@ -227,6 +221,44 @@ async def upload_profile_pic(
     return {"success": True, "url": url}
 
 
+@router.post("/profile/image/presign", response_model=ProfileImageUploadResponse)
+async def presign_profile_image(
+    data: ProfileImageUploadRequest,
+    current_profile: dict = Depends(get_current_profile),
+    supabase: AsyncClient = Depends(get_supabase_client),
+):
+    """
+    Get a signed URL to upload a profile or backdrop image to directly.
+
+    Args:
+        data (ProfileImageUploadRequest): Image type and file extension.
+
+    Returns:
+        ProfileImageUploadResponse: Upload URL and the path to commit.
+    """
+    return await create_profile_image_upload(data, current_profile["id"], supabase)
+
+
+@router.post("/profile/image/commit")
+async def commit_profile_image_upload(
+    data: ProfileImageCommitRequest,
+    request: Request,
+    current_profile: dict = Depends(get_current_profile),
+    supabase: AsyncClient = Depends(get_supabase_client),
+):
+    """
+    Make an image uploaded through the signed URL the active one.
+
+    Args:
+        data (ProfileImageCommitRequest): Image type and uploaded path.
+
+    Returns:
+        dict: Success status and image URL.
+    """
+    url = await commit_profile_image(data, current_profile["id"], supabase, request)
+    return {"success": True, "url": url}
+
+
 @router.post("/profile/backdrop")
 async def upload_backdrop(
     file: UploadFile = File(...),
@@ -243,11 +275,6 @@ async def upload_backdrop(
     Returns:
         dict: Success status and image URL.
     """
-    logger.info(
-        "backdrop_image_upload_requested",
-        user_id=current_profile["id"],
-        image_type="backdrop",
-    )
     url = await upload_profile_image(
         file, current_profile["id"], "backdrop", supabase, request
     )
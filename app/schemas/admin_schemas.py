@@ -1,10 +1,14 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List, Literal, Dict, Any
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 from app.schemas.user_schemas import UserType
 
+# Query-parameter models are built on every list call and never mutated
+QUERY_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
 # ========================
 # USER MANAGEMENT SCHEMAS
 # ========================
@@ -53,6 +57,8 @@ class AdminUserResponse(BaseModel):
 class UserFilterParams(BaseModel):
     """Filters for user listing"""
 
+    model_config = QUERY_MODEL_CONFIG
+
     user_type: Optional[UserType] = None
     is_verified: Optional[bool] = None
     is_blocked: Optional[bool] = None
@@ -66,9 +72,12 @@ class UsersListResponse(BaseModel):
     """Paginated users list"""
 
     users: List[AdminUserResponse]
-    total: int
+    # Omitted on cursor pages, where counting would cost a full scan
+    total: Optional[int] = None
     page: int
     page_size: int
+    # Pass back as `after` to fetch the next page by keyset
+    next_cursor: Optional[str] = None
 
 
 # ========================
@@ -79,6 +88,8 @@ class UsersListResponse(BaseModel):
 class OrderFilterParams(BaseModel):
     """Filters for order listing"""
 
+    model_config = QUERY_MODEL_CONFIG
+
     order_type: Optional[Literal["food", "delivery", "laundry"]] = None
     status: Optional[str] = None
     payment_status: Optional[str] = None
@@ -116,9 +127,12 @@ class OrdersListResponse(BaseModel):
     """Paginated orders list"""
 
     orders: List[AdminOrderResponse]
-    total: int
+    # Omitted on cursor pages, where counting would cost a full scan
+    total: Optional[int] = None
     page: int
     page_size: int
+    # Pass back as `after` to fetch the next page by keyset
+    next_cursor: Optional[str] = None
 
 
 class OrderStatusUpdate(BaseModel):
@@ -136,6 +150,8 @@ class OrderStatusUpdate(BaseModel):
 class TransactionFilterParams(BaseModel):
     """Filters for transaction listing"""
 
+    model_config = QUERY_MODEL_CONFIG
+
     transaction_type: Optional[str] = None
     status: Optional[str] = None
     from_user_id: Optional[UUID] = None
@@ -170,9 +186,12 @@ class TransactionsListResponse(BaseModel):
     """Paginated transactions list"""
 
     transactions: List[AdminTransactionResponse]
-    total: int
+    # Omitted on cursor pages, where counting would cost a full scan
+    total: Optional[int] = None
     page: int
     page_size: int
+    # Pass back as `after` to fetch the next page by keyset
+    next_cursor: Optional[str] = None
 
 
 # ========================
@@ -266,6 +285,8 @@ class RevenueReportResponse(BaseModel):
 class AuditLogFilterParams(BaseModel):
     """Filters for audit log"""
 
+    model_config = QUERY_MODEL_CONFIG
+
     entity_type: Optional[str] = None
     action: Optional[str] = None
     actor_id: Optional[UUID] = None
@@ -348,5 +369,7 @@ class SystemSettingResponse(BaseModel):
 class PaginationParams(BaseModel):
     """Standard pagination parameters"""
 
+    model_config = QUERY_MODEL_CONFIG
+
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from typing import Any, Dict, Optional, List, Literal
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
@@ -105,6 +105,16 @@ class VendorDetailResponse(BaseModel):
     menu: List[FoodItemResponse] = []  # Grouped by category in frontend
 
 
+class FoodVendorDashboardResponse(BaseModel):
+    vendor: VendorDetailResponse
+    earnings: Any = None  # get_vendor_earnings RPC result, as returned
+
+
+class VendorMenuItemsResponse(BaseModel):
+    # Rows as returned by PostgREST; typed so FastAPI serialises in pydantic-core
+    items: List[Dict[str, Any]]
+
+
 class VendorOrderItemResponse(BaseModel):
     item_id: UUID
     name: str
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from typing import Any, Dict, Optional, List, Literal
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
@@ -74,6 +74,11 @@ class LaundryVendorDetailResponse(BaseModel):
     menu: List[LaundryItemResponse] = []
 
 
+class LaundryMenuItemsResponse(BaseModel):
+    # Rows as returned by PostgREST; typed so FastAPI serialises in pydantic-core
+    items: List[Dict[str, Any]]
+
+
 class LaundryVendorOrderItemResponse(BaseModel):
     item_id: UUID
     name: str
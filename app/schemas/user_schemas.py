@@ -192,6 +192,22 @@ class RiderEarningsResponse(BaseModel):
     period: str = "all_time"  # Can extend to weekly/monthly later
 
 
+class ProfileImageUploadRequest(BaseModel):
+    image_type: Literal["profile", "backdrop"] = "profile"
+    file_ext: Literal["jpg", "jpeg", "png", "webp"]
+
+
+class ProfileImageUploadResponse(BaseModel):
+    upload_url: str  # PUT the image bytes here
+    token: str
+    path: str  # send back to the commit endpoint once uploaded
+
+
+class ProfileImageCommitRequest(BaseModel):
+    image_type: Literal["profile", "backdrop"] = "profile"
+    path: str
+
+
 class OnlineStatusToggle(BaseModel):
     is_online: bool = Field(
         ..., description="True = online / available, False = offline"
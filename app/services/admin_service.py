@@ -1,4 +1,7 @@
-from datetime import timedelta
+import asyncio
+import base64
+import binascii
+from datetime import datetime, time, timedelta
 from typing import cast
 from supabase import AsyncClient
 from postgrest.types import CountMethod
@@ -6,19 +9,98 @@ from fastapi import HTTPException, Request
 from app.config.logging import logger
 from app.schemas.admin_schemas import *
 from app.schemas.user_schemas import UserType
-from app.utils.audit import log_audit_event
+from app.utils.audit import enqueue_audit_event, log_audit_event
+from app.dependencies.auth_cache import invalidate_profile
+from app.database.redis import get_redis
 
 # ───────────────────────────────────────────────
 # USER MANAGEMENT
 # ───────────────────────────────────────────────
 
 
+def _created_before(query, created_to: datetime):
+    """
+    Apply the upper `created_at` bound to a query.
+
+    A bare date (midnight) means "through the end of that day", expressed as
+    the half-open `< next midnight` so the `created_at` index is range-scanned.
+    """
+    if created_to.time() == time.min:
+        return query.lt("created_at", (created_to + timedelta(days=1)).isoformat())
+    return query.lte("created_at", created_to.isoformat())
+
+
+def _encode_cursor(created_at: str, row_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Split a cursor back into (created_at, id). Both parts are parsed and
+    re-serialised, so only a timestamp and a UUID reach the filter string.
+    """
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at).isoformat(), str(UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_cursor(query, cursor: str):
+    """Keep rows that come after `cursor` in (created_at, id) descending order."""
+    created_at, row_id = _decode_cursor(cursor)
+    return query.or_(
+        f'created_at.lt."{created_at}",'
+        f'and(created_at.eq."{created_at}",id.lt.{row_id})'
+    )
+
+
+def _next_cursor(rows: list, page_size: int) -> Optional[str]:
+    """Cursor for the page after `rows`, or None if this page was the last."""
+    if len(rows) < page_size:
+        return None
+    return _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+
+def _search_filter(term: str) -> str:
+    """PostgREST `or` filter matching name, email or phone (case-insensitive)."""
+    # Characters that would break the or=(...) grammar are dropped
+    cleaned = "".join(ch for ch in term if ch not in ',()"\\').strip()
+    pattern = f"*{cleaned}*"
+    return (
+        f"full_name.ilike.{pattern},"
+        f"email.ilike.{pattern},"
+        f"phone_number.ilike.{pattern}"
+    )
+
+
+async def _attach_user_stats(user_data: dict, admin_client: AsyncClient) -> dict:
+    order_stats, wallet_stats = await asyncio.gather(
+        get_user_order_stats(user_data["id"], admin_client),
+        get_user_wallet_stats(user_data["id"], admin_client),
+    )
+    user_data["total_orders"] = order_stats.get("total_orders", 0)
+    user_data["total_spent"] = wallet_stats.get("total_spent", 0)
+    user_data["total_earned"] = wallet_stats.get("total_earned", 0)
+    return user_data
+
+
 async def list_users(
-    filters: UserFilterParams, pagination: PaginationParams, admin_client: AsyncClient
+    filters: UserFilterParams,
+    pagination: PaginationParams,
+    admin_client: AsyncClient,
+    after: Optional[str] = None,
 ) -> UsersListResponse:
-    """List all users with filters and pagination"""
+    """
+    List all users with filters and pagination.
+
+    With `after` the page is read by keyset, like `list_transactions`.
+    """
     try:
-        query = admin_client.table("profiles").select("*", count="exact")
+        # The exact count is an extra scan; cursor pages go without it
+        query = admin_client.table("profiles").select(
+            "*", count=None if after else "exact"
+        )
 
         # Apply filters
         if filters.user_type:
@@ -34,56 +116,33 @@ async def list_users(
         if filters.created_to:
             query = query.lte("created_at", filters.created_to.isoformat())
         if filters.search:
-            # Search in name, email, phone - use ilike with separate filters
-            search_term = f"%{filters.search}%"
-
-            pass  # Will filter after fetch
-
-        # Get total count
-        count_resp = await query.execute()
-        total = count_resp.count if count_resp.count else 0
-
-        # Get all matching users first (for search filtering)
-        resp = await query.order("created_at", desc=True).execute()
-
-        # Apply search filter in Python if needed
-        filtered_data = resp.data
-        if filters.search:
-            search_term = filters.search.lower()
-            filtered_data = [
-                u
-                for u in resp.data
-                if search_term in (u.get("full_name", "") or "").lower()
-                or search_term in (u.get("email", "") or "").lower()
-                or search_term in (u.get("phone_number", "") or "").lower()
-            ]
-
-        # Apply pagination after filtering
-        total = len(filtered_data)
-        offset = (pagination.page - 1) * pagination.page_size
-        paginated_data = filtered_data[offset : offset + pagination.page_size]
+            query = query.or_(_search_filter(filters.search))
+
+        # Rows and total count in a single round trip
+        query = query.order("created_at", desc=True).order("id", desc=True)
+        if after:
+            query = _after_cursor(query, after).limit(pagination.page_size)
+        else:
+            offset = (pagination.page - 1) * pagination.page_size
+            query = query.range(offset, offset + pagination.page_size - 1)
+        resp = await query.execute()
+        total = None if after else resp.count or 0
 
         # Enhance with stats
-        users = []
-        for user_data in paginated_data:
-            user_id = user_data["id"]
-
-            # Get order stats
-            order_stats = await get_user_order_stats(user_id, admin_client)
-            wallet_stats = await get_user_wallet_stats(user_id, admin_client)
-
-            user_data["total_orders"] = order_stats.get("total_orders", 0)
-            user_data["total_spent"] = wallet_stats.get("total_spent", 0)
-            user_data["total_earned"] = wallet_stats.get("total_earned", 0)
-
-            users.append(AdminUserResponse(**user_data))
+        enriched = await asyncio.gather(
+            *(_attach_user_stats(user_data, admin_client) for user_data in resp.data)
+        )
+        users = [AdminUserResponse(**user_data) for user_data in enriched]
 
         return UsersListResponse(
             users=users,
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
+            next_cursor=_next_cursor(resp.data, pagination.page_size),
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("admin_list_users_error", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list users: {str(e)}")
@@ -171,7 +230,7 @@ async def update_user(
             raise HTTPException(status_code=500, detail="Update failed")
 
         # Audit log
-        await log_audit_event(
+        await enqueue_audit_event(
             admin_client,
             entity_type="USER",
             entity_id=str(user_id),
@@ -184,6 +243,8 @@ async def update_user(
             request=request,
         )
 
+        await invalidate_profile(str(user_id))
+
         logger.info(
             "admin_user_updated",
             admin_id=str(admin_id),
@@ -247,7 +308,7 @@ async def block_unblock_user(
         )
 
         # Audit log
-        await log_audit_event(
+        await enqueue_audit_event(
             admin_client,
             entity_type="USER",
             entity_id=str(user_id),
@@ -260,6 +321,8 @@ async def block_unblock_user(
             request=request,
         )
 
+        await invalidate_profile(str(user_id))
+
         logger.info(
             "admin_user_blocked",
             admin_id=str(admin_id),
@@ -317,7 +380,7 @@ async def verify_user(
         )
 
         # Audit log
-        await log_audit_event(
+        await enqueue_audit_event(
             admin_client,
             entity_type="USER",
             entity_id=str(user_id),
@@ -330,6 +393,8 @@ async def verify_user(
             request=request,
         )
 
+        await invalidate_profile(str(user_id))
+
         logger.info(
             "admin_user_verified",
             admin_id=str(admin_id),
@@ -365,28 +430,22 @@ async def get_user_order_stats(
 ) -> Dict[str, Any]:
     """Get order statistics for a user"""
     try:
-        # Food orders as customer
-        food_orders = (
-            await admin_client.table("food_orders")
-            .select("grand_total", count="exact")
+        food_orders, vendor_orders, delivery_orders = await asyncio.gather(
+            # Food orders as customer
+            admin_client.table("food_orders")
+            .select("id", count="exact", head=True)
             .eq("customer_id", user_id)
-            .execute()
-        )
-
-        # Food orders as vendor
-        vendor_orders = (
-            await admin_client.table("food_orders")
-            .select("grand_total", count="exact")
+            .execute(),
+            # Food orders as vendor
+            admin_client.table("food_orders")
+            .select("id", count="exact", head=True)
             .eq("vendor_id", user_id)
-            .execute()
-        )
-
-        # Delivery orders
-        delivery_orders = (
-            await admin_client.table("delivery_orders")
-            .select("grand_total", count="exact")
+            .execute(),
+            # Delivery orders
+            admin_client.table("delivery_orders")
+            .select("id", count="exact", head=True)
             .eq("sender_id", user_id)
-            .execute()
+            .execute(),
         )
 
         total_orders = (food_orders.count or 0) + (delivery_orders.count or 0)
@@ -457,68 +516,121 @@ async def get_user_wallet_stats(
 # ───────────────────────────────────────────────
 
 
+def _food_orders_query(
+    filters: OrderFilterParams, admin_client: AsyncClient, count: Optional[str]
+):
+    food_query = admin_client.table("food_orders").select("*", count=count)
+
+    if filters.status:
+        food_query = food_query.eq("order_status", filters.status)
+    if filters.payment_status:
+        food_query = food_query.eq("payment_status", filters.payment_status)
+    if filters.customer_id:
+        food_query = food_query.eq("customer_id", filters.customer_id)
+    if filters.vendor_id:
+        food_query = food_query.eq("vendor_id", filters.vendor_id)
+    if filters.created_from:
+        food_query = food_query.gte("created_at", filters.created_from.isoformat())
+    if filters.created_to:
+        food_query = food_query.lte("created_at", filters.created_to.isoformat())
+
+    return food_query
+
+
+def _delivery_orders_query(
+    filters: OrderFilterParams, admin_client: AsyncClient, count: Optional[str]
+):
+    delivery_query = admin_client.table("delivery_orders").select("*", count=count)
+
+    if filters.status:
+        delivery_query = delivery_query.eq("order_status", filters.status)
+    if filters.customer_id:
+        delivery_query = delivery_query.eq("sender_id", filters.customer_id)
+    if filters.rider_id:
+        delivery_query = delivery_query.eq("rider_id", filters.rider_id)
+    if filters.created_from:
+        delivery_query = delivery_query.gte(
+            "created_at", filters.created_from.isoformat()
+        )
+    if filters.created_to:
+        delivery_query = delivery_query.lte(
+            "created_at", filters.created_to.isoformat()
+        )
+
+    return delivery_query
+
+
 async def list_orders(
-    filters: OrderFilterParams, pagination: PaginationParams, admin_client: AsyncClient
+    filters: OrderFilterParams,
+    pagination: PaginationParams,
+    admin_client: AsyncClient,
+    after: Optional[str] = None,
 ) -> OrdersListResponse:
-    """List all orders with filters"""
+    """
+    List all orders with filters.
+
+    With `after` each source is read by keyset from the cursor, so the merged
+    page costs the same at any depth; cursor pages carry no total.
+    """
     try:
-        orders = []
+        offset = 0 if after else (pagination.page - 1) * pagination.page_size
+        count = None if after else "exact"
 
-        # Food orders
+        # Each source only needs its newest `offset + page_size` rows for the
+        # merged page to be exact; counts come back on the same responses.
+        queries = {}
         if not filters.order_type or filters.order_type == "food":
-            food_query = admin_client.table("food_orders").select("*")
-
-            if filters.status:
-                food_query = food_query.eq("order_status", filters.status)
-            if filters.payment_status:
-                food_query = food_query.eq("payment_status", filters.payment_status)
-            if filters.customer_id:
-                food_query = food_query.eq("customer_id", filters.customer_id)
-            if filters.vendor_id:
-                food_query = food_query.eq("vendor_id", filters.vendor_id)
-            if filters.created_from:
-                food_query = food_query.gte(
-                    "created_at", filters.created_from.isoformat()
-                )
-            if filters.created_to:
-                food_query = food_query.lte(
-                    "created_at", filters.created_to.isoformat()
-                )
+            queries["food"] = _food_orders_query(filters, admin_client, count)
+        if not filters.order_type or filters.order_type == "delivery":
+            queries["delivery"] = _delivery_orders_query(filters, admin_client, count)
 
-            food_resp = await food_query.order("created_at", desc=True).execute()
-
-            # Get user names separately if needed
-            customer_ids = set()
-            vendor_ids = set()
-            for order in food_resp.data:
-                if order.get("customer_id"):
-                    customer_ids.add(order["customer_id"])
-                if order.get("vendor_id"):
-                    vendor_ids.add(order["vendor_id"])
-
-            # Fetch profiles in batch
-            customer_profiles = {}
-            vendor_profiles = {}
-            if customer_ids:
-                customer_resp = (
-                    await admin_client.table("profiles")
-                    .select("id, full_name")
-                    .in_("id", list(customer_ids))
-                    .execute()
-                )
-                customer_profiles = {p["id"]: p for p in customer_resp.data}
-            if vendor_ids:
-                vendor_resp = (
-                    await admin_client.table("profiles")
-                    .select("id, full_name, store_name")
-                    .in_("id", list(vendor_ids))
-                    .execute()
-                )
-                vendor_profiles = {p["id"]: p for p in vendor_resp.data}
+        if after:
+            queries = {name: _after_cursor(q, after) for name, q in queries.items()}
+
+        responses = await asyncio.gather(
+            *(
+                query.order("created_at", desc=True)
+                .order("id", desc=True)
+                .limit(offset + pagination.page_size)
+                .execute()
+                for query in queries.values()
+            )
+        )
+        results = dict(zip(queries.keys(), responses))
+
+        rows = []
+        for order_type, resp in results.items():
+            rows.extend((order_type, order) for order in resp.data)
+
+        # Sort all orders by (created_at, id) desc, the cursor's order
+        rows.sort(key=lambda row: (row[1]["created_at"], row[1]["id"]), reverse=True)
+
+        # Apply pagination
+        total = None if after else sum((resp.count or 0) for resp in results.values())
+        page_rows = rows[offset : offset + pagination.page_size]
+
+        # Fetch names for this page only, in one batch
+        profile_ids = set()
+        for order_type, order in page_rows:
+            for key in ("customer_id", "vendor_id", "sender_id"):
+                if order.get(key):
+                    profile_ids.add(order[key])
+
+        profiles = {}
+        if profile_ids:
+            profile_resp = (
+                await admin_client.table("profiles")
+                .select("id, full_name, store_name")
+                .in_("id", list(profile_ids))
+                .execute()
+            )
+            profiles = {p["id"]: p for p in profile_resp.data}
 
-            for order in food_resp.data:
-                customer = customer_profiles.get(order.get("customer_id"), {})
-                vendor = vendor_profiles.get(order.get("vendor_id"), {})
+        orders = []
+        for order_type, order in page_rows:
+            if order_type == "food":
+                customer = profiles.get(order.get("customer_id"), {})
+                vendor = profiles.get(order.get("vendor_id"), {})
 
                 orders.append(
                     {
@@ -538,48 +650,8 @@ async def list_orders(
                         "updated_at": order.get("updated_at"),
                     }
                 )
-
-        # Delivery orders
-        if not filters.order_type or filters.order_type == "delivery":
-            delivery_query = admin_client.table("delivery_orders").select("*")
-
-            if filters.status:
-                delivery_query = delivery_query.eq("order_status", filters.status)
-            if filters.customer_id:
-                delivery_query = delivery_query.eq("sender_id", filters.customer_id)
-            if filters.rider_id:
-                delivery_query = delivery_query.eq("rider_id", filters.rider_id)
-            if filters.created_from:
-                delivery_query = delivery_query.gte(
-                    "created_at", filters.created_from.isoformat()
-                )
-            if filters.created_to:
-                delivery_query = delivery_query.lte(
-                    "created_at", filters.created_to.isoformat()
-                )
-
-            delivery_resp = await delivery_query.order(
-                "created_at", desc=True
-            ).execute()
-
-            # Get sender names
-            sender_ids = {
-                order["sender_id"]
-                for order in delivery_resp.data
-                if order.get("sender_id")
-            }
-            sender_profiles = {}
-            if sender_ids:
-                sender_profile_resp = (
-                    await admin_client.table("profiles")
-                    .select("id, full_name")
-                    .in_("id", list(sender_ids))
-                    .execute()
-                )
-                sender_profiles = {p["id"]: p for p in sender_profile_resp.data}
-
-            for order in delivery_resp.data:
-                sender = sender_profiles.get(order.get("sender_id"), {})
+            else:
+                sender = profiles.get(order.get("sender_id"), {})
 
                 orders.append(
                     {
@@ -599,20 +671,17 @@ async def list_orders(
                     }
                 )
 
-        # Sort all orders by created_at desc
-        orders.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Apply pagination
-        total = len(orders)
-        offset = (pagination.page - 1) * pagination.page_size
-        paginated_orders = orders[offset : offset + pagination.page_size]
-
         return OrdersListResponse(
-            orders=[AdminOrderResponse(**order) for order in paginated_orders],
+            orders=[AdminOrderResponse(**order) for order in orders],
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
+            next_cursor=_next_cursor(
+                [order for _, order in page_rows], pagination.page_size
+            ),
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("admin_list_orders_error", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list orders: {str(e)}")
@@ -627,12 +696,20 @@ async def list_transactions(
     filters: TransactionFilterParams,
     pagination: PaginationParams,
     admin_client: AsyncClient,
+    after: Optional[str] = None,
 ) -> TransactionsListResponse:
-    """List all transactions with filters"""
+    """
+    List all transactions with filters.
+
+    With `after` (a previous page's `next_cursor`) the page is read by keyset
+    on (created_at, id), so it costs the same at any depth; otherwise
+    `pagination.page` is used as a plain offset.
+    """
     try:
+        # The exact count is an extra scan; cursor pages go without it
         query = admin_client.table("transactions").select(
-            "*, profiles!transactions_from_user_id_fkey(full_name), profiles!transactions_to_user_id_fkey(full_name)",
-            count="exact",
+            "*, from_profile:profiles!transactions_from_user_id_fkey(full_name), to_profile:profiles!transactions_to_user_id_fkey(full_name)",
+            count=None if after else "exact",
         )
 
         if filters.transaction_type:
@@ -646,24 +723,26 @@ async def list_transactions(
         if filters.created_from:
             query = query.gte("created_at", filters.created_from.isoformat())
         if filters.created_to:
-            query = query.lte("created_at", filters.created_to.isoformat())
-        if filters.min_amount:
-            query = query.gte("amount", float(filters.min_amount))
-        if filters.max_amount:
-            query = query.lte("amount", float(filters.max_amount))
-
-        count_resp = await query.execute()
-        total = count_resp.count if count_resp.count else 0
-
-        offset = (pagination.page - 1) * pagination.page_size
-        query = query.order("created_at", desc=True).range(
-            offset, offset + pagination.page_size - 1
-        )
-
+            query = _created_before(query, filters.created_to)
+        if filters.min_amount is not None:
+            query = query.gte("amount", str(filters.min_amount))
+        if filters.max_amount is not None:
+            query = query.lte("amount", str(filters.max_amount))
+
+        # Rows and the exact total come back in one response
+        query = query.order("created_at", desc=True).order("id", desc=True)
+        if after:
+            query = _after_cursor(query, after).limit(pagination.page_size)
+        else:
+            offset = (pagination.page - 1) * pagination.page_size
+            query = query.range(offset, offset + pagination.page_size - 1)
         resp = await query.execute()
+        total = None if after else resp.count or 0
 
         transactions = []
         for tx in resp.data:
+            from_profile = tx.get("from_profile") or {}
+            to_profile = tx.get("to_profile") or {}
             transactions.append(
                 AdminTransactionResponse(
                     id=tx["id"],
@@ -673,9 +752,9 @@ async def list_transactions(
                     status=tx["status"],
                     payment_method=tx.get("payment_method"),
                     from_user_id=tx.get("from_user_id"),
-                    from_user_name=None,  # Would need proper join
+                    from_user_name=from_profile.get("full_name"),
                     to_user_id=tx.get("to_user_id"),
-                    to_user_name=None,  # Would need proper join
+                    to_user_name=to_profile.get("full_name"),
                     created_at=tx["created_at"],
                     details=tx.get("details"),
                 )
@@ -686,7 +765,10 @@ async def list_transactions(
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
+            next_cursor=_next_cursor(resp.data, pagination.page_size),
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("admin_list_transactions_error", error=str(e), exc_info=True)
         raise HTTPException(
@@ -704,17 +786,18 @@ async def list_wallets(
 ) -> WalletsListResponse:
     """List all wallets"""
     try:
-        query = admin_client.table("wallets").select("*, profiles(*)", count="exact")
-
-        count_resp = await query.execute()
-        total = count_resp.count if count_resp.count else 0
+        query = admin_client.table("wallets").select(
+            "*, profiles(full_name, store_name, user_type)", count="exact"
+        )
 
+        # Rows and the exact total come back in one response
         offset = (pagination.page - 1) * pagination.page_size
-        query = query.order("created_at", desc=True).range(
-            offset, offset + pagination.page_size - 1
+        resp = await (
+            query.order("created_at", desc=True)
+            .range(offset, offset + pagination.page_size - 1)
+            .execute()
         )
-
-        resp = await query.execute()
+        total = resp.count or 0
 
         wallets = []
         for wallet in resp.data:
@@ -867,6 +950,8 @@ async def adjust_wallet(
 
         profile = profile_resp.data if profile_resp.data else {}
 
+        await invalidate_dashboard_stats()
+
         logger.info(
             "admin_wallet_adjusted",
             admin_id=str(admin_id),
@@ -900,45 +985,99 @@ async def adjust_wallet(
 # ========================
 
 
+# Upper bound for the dashboard's concurrent reads as a whole
+DASHBOARD_STATS_TIMEOUT = 5.0
+
+# Cache-aside copy of the stats; only one worker recomputes at a time
+DASHBOARD_CACHE_KEY = "admin:dashboard:v1"
+DASHBOARD_CACHE_TTL = 45
+DASHBOARD_LOCK_TTL = 5
+DASHBOARD_LOCK_WAIT = 0.2
+DASHBOARD_LOCK_RETRIES = 10
+
+
+async def _cached_dashboard_stats() -> Optional[DashboardStatsResponse]:
+    cached = await get_redis().get(DASHBOARD_CACHE_KEY)
+    return DashboardStatsResponse.model_validate_json(cached) if cached else None
+
+
+async def invalidate_dashboard_stats() -> None:
+    try:
+        await get_redis().delete(DASHBOARD_CACHE_KEY)
+    except Exception as e:
+        logger.warning("dashboard_cache_unavailable", error=str(e))
+
+
 async def get_dashboard_stats(admin_client: AsyncClient) -> DashboardStatsResponse:
-    """Get overall dashboard statistics"""
+    """Get overall dashboard statistics, served from Redis for up to 45s"""
+    redis = get_redis()
+    lock_key = f"{DASHBOARD_CACHE_KEY}:lock"
     try:
-        # User stats
-        all_users = (
-            await admin_client.table("profiles")
-            .select("id, user_type, is_blocked, is_online", count="exact")
-            .execute()
-        )
-        active_users = (
-            await admin_client.table("profiles")
-            .select("id", count="exact")
-            .eq("is_online", True)
-            .execute()
-        )
-        blocked_users = (
-            await admin_client.table("profiles")
-            .select("id", count="exact")
-            .eq("is_blocked", True)
-            .execute()
-        )
+        stats = await _cached_dashboard_stats()
+        if stats is not None:
+            return stats
+
+        # Losers of the lock wait briefly for the winner's result
+        if not await redis.set(lock_key, "1", nx=True, ex=DASHBOARD_LOCK_TTL):
+            for _ in range(DASHBOARD_LOCK_RETRIES):
+                await asyncio.sleep(DASHBOARD_LOCK_WAIT)
+                stats = await _cached_dashboard_stats()
+                if stats is not None:
+                    return stats
+    except Exception as e:
+        logger.warning("dashboard_cache_unavailable", error=str(e))
 
-        # Order stats
-        food_orders = (
-            await admin_client.table("food_orders")
-            .select("order_status, grand_total, created_at", count="exact")
-            .execute()
-        )
-        delivery_orders = (
-            await admin_client.table("delivery_orders")
-            .select("order_status, grand_total, created_at", count="exact")
-            .execute()
+    stats = await compute_dashboard_stats(admin_client)
+
+    try:
+        await redis.set(
+            DASHBOARD_CACHE_KEY, stats.model_dump_json(), ex=DASHBOARD_CACHE_TTL
         )
+        await redis.delete(lock_key)
+    except Exception as e:
+        logger.warning("dashboard_cache_unavailable", error=str(e))
 
-        # Transaction stats
-        all_transactions = (
-            await admin_client.table("transactions")
-            .select("amount, created_at, status", count="exact")
-            .execute()
+    return stats
+
+
+async def compute_dashboard_stats(admin_client: AsyncClient) -> DashboardStatsResponse:
+    """Compute overall dashboard statistics from the database"""
+    try:
+        # Independent reads: run them concurrently, bounded as a group
+        (
+            all_users,
+            active_users,
+            blocked_users,
+            food_orders,
+            delivery_orders,
+            all_transactions,
+        ) = await asyncio.wait_for(
+            asyncio.gather(
+                # User stats
+                admin_client.table("profiles")
+                .select("id, user_type, is_blocked, is_online", count="exact")
+                .execute(),
+                admin_client.table("profiles")
+                .select("id", count="exact", head=True)
+                .eq("is_online", True)
+                .execute(),
+                admin_client.table("profiles")
+                .select("id", count="exact", head=True)
+                .eq("is_blocked", True)
+                .execute(),
+                # Order stats
+                admin_client.table("food_orders")
+                .select("order_status, grand_total, created_at", count="exact")
+                .execute(),
+                admin_client.table("delivery_orders")
+                .select("order_status, grand_total, created_at", count="exact")
+                .execute(),
+                # Transaction stats
+                admin_client.table("transactions")
+                .select("amount, created_at, status", count="exact")
+                .execute(),
+            ),
+            timeout=DASHBOARD_STATS_TIMEOUT,
         )
 
         # Calculate revenue
@@ -1052,15 +1191,14 @@ async def list_audit_logs(
         if filters.created_to:
             query = query.lte("created_at", filters.created_to.isoformat())
 
-        count_resp = await query.execute()
-        total = count_resp.count if count_resp.count else 0
-
+        # Rows and the exact total come back in one response
         offset = (pagination.page - 1) * pagination.page_size
-        query = query.order("created_at", desc=True).range(
-            offset, offset + pagination.page_size - 1
+        resp = await (
+            query.order("created_at", desc=True)
+            .range(offset, offset + pagination.page_size - 1)
+            .execute()
         )
-
-        resp = await query.execute()
+        total = resp.count or 0
 
         logs = [AuditLogResponse(**log) for log in resp.data]
 
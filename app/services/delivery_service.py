@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import HTTPException, status, Request
 from typing import Optional
 import uuid
@@ -55,27 +56,25 @@ async def initiate_delivery_payment(
         data=data.model_dump(),
     )
     try:
-        # 1. Calculate distance using RPC
-        distance_resp = await supabase.rpc(
-            "calculate_distance",
-            {
-                "p_lat1": data.pickup_coordinates[0],
-                "p_lng1": data.pickup_coordinates[1],
-                "p_lat2": data.dropoff_coordinates[0],
-                "p_lng2": data.dropoff_coordinates[1],
-            },
-        ).execute()
-
-        distance_km = distance_resp.data if distance_resp.data is not None else 0.0
-
-        # 2. Get charges from DB
-        charges = (
-            await supabase.table("charges_and_commissions")
+        # 1-2. Distance (RPC) and charges are independent: fetch concurrently
+        distance_resp, charges = await asyncio.gather(
+            supabase.rpc(
+                "calculate_distance",
+                {
+                    "p_lat1": data.pickup_coordinates[0],
+                    "p_lng1": data.pickup_coordinates[1],
+                    "p_lat2": data.dropoff_coordinates[0],
+                    "p_lng2": data.dropoff_coordinates[1],
+                },
+            ).execute(),
+            supabase.table("charges_and_commissions")
             .select("base_delivery_fee, delivery_fee_per_km")
             .single()
-            .execute()
+            .execute(),
         )
 
+        distance_km = distance_resp.data if distance_resp.data is not None else 0.0
+
         if not charges.data:
             raise HTTPException(
                 status.HTTP_500_INTERNAL_SERVER_ERROR, "Charges configuration missing"
@@ -653,7 +652,9 @@ async def get_delivery_orders(
         resp = await query.execute()
         orders = resp.data or []
 
-        count_query = supabase.table("delivery_orders").select("count", count="exact")
+        count_query = supabase.table("delivery_orders").select(
+            "id", count="exact", head=True
+        )
         if not is_admin:
             count_query = count_query.or_(
                 f"sender_id.eq.{current_user_id},"
@@ -294,7 +294,8 @@ async def get_my_disputes(
                 resolved_by_id,
                 resolved_at,
                 created_at,
-                updated_at
+                updated_at,
+                dispute_messages(count)
             """)
             .or_(
                 f"initiator_id.eq.{current_user_id},respondent_id.eq.{current_user_id}"
@@ -308,13 +309,8 @@ async def get_my_disputes(
         # Build responses (lightweight - no full messages here)
         result = []
         for d in disputes:
-            # Optional: get message count for preview
-            count_resp = (
-                await supabase.table("dispute_messages")
-                .select("count", count="exact")
-                .eq("dispute_id", d["id"])
-                .execute()
-            )
+            # Message count for preview, embedded as [{"count": n}]
+            message_counts = d.get("dispute_messages") or []
 
             dispute_data = DisputeResponse(
                 id=d["id"],
@@ -331,7 +327,9 @@ async def get_my_disputes(
                 updated_at=d["updated_at"],
                 messages=[],
             )
-            dispute_data.message_count = count_resp.count or 0  # optional field
+            dispute_data.message_count = (
+                message_counts[0]["count"] if message_counts else 0
+            )  # optional field
 
             result.append(dispute_data)
 
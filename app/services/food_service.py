@@ -1,10 +1,14 @@
+import asyncio
+import time
 from uuid import UUID
 import uuid
+from pydantic import TypeAdapter
 from supabase.client import AsyncClient
 from fastapi import HTTPException, UploadFile, Request
 from app.schemas.food_schemas import *
 from app.utils.storage import upload_to_supabase_storage
-from app.utils.redis_utils import save_pending
+from app.utils.redis_utils import get_or_load_cached, save_pending
+from app.database.redis import get_redis
 from app.config.config import settings
 from app.schemas.common import (
     PaymentInitializationResponse,
@@ -20,15 +24,100 @@ from datetime import datetime
 from app.services.notification_service import notify_user
 
 
+# Public browse reads are shared by every customer, so they are cached in
+# Redis (cache-aside). Menu entries are dropped when the vendor edits an item.
+VENDORS_CACHE_TTL = 60
+VENDOR_MENU_CACHE_TTL = 300
+# A vendor's menu version is a timestamp rewritten on every item change, so a
+# version lost to expiry or eviction can never be reissued for other content.
+# Expiry also bounds how long an edit made outside this module (SQL, the
+# dashboard) can hide behind a 304.
+MENU_VERSION_TTL = 15 * 60
+# ~110 m: nearby searches from the same area share one cache entry
+VENDORS_COORD_PRECISION = 3
+
+MAX_MENU_ITEM_IMAGES = 5
+
+_vendor_cards = TypeAdapter(List[VendorCardResponse])
+
+
+# Every cached listing key, so a vendor profile edit can drop them all
+VENDORS_CACHE_INDEX = "food:vendors:v1:keys"
+
+
+def _vendor_menu_key(vendor_id) -> str:
+    return f"food:vendor:v1:{vendor_id}"
+
+
+def _menu_version_key(vendor_id) -> str:
+    return f"food:menu_version:v1:{vendor_id}"
+
+
+async def invalidate_vendor_menu(vendor_id) -> None:
+    try:
+        redis = get_redis()
+        await redis.delete(_vendor_menu_key(vendor_id))
+        await redis.set(
+            _menu_version_key(vendor_id), str(time.time_ns()), ex=MENU_VERSION_TTL
+        )
+    except Exception as e:
+        logger.warning("food_cache_unavailable", error=str(e))
+
+
+async def invalidate_food_vendor(vendor_id) -> None:
+    """Drop a vendor's cached detail and every cached vendor listing."""
+    try:
+        redis = get_redis()
+        listing_keys = await redis.smembers(VENDORS_CACHE_INDEX)
+        await redis.delete(
+            _vendor_menu_key(vendor_id), VENDORS_CACHE_INDEX, *listing_keys
+        )
+    except Exception as e:
+        logger.warning("food_cache_unavailable", error=str(e))
+
+
+async def get_menu_version(vendor_id) -> Optional[str]:
+    """Current version of a vendor's menu, or None if Redis is unavailable."""
+    key = _menu_version_key(vendor_id)
+    try:
+        redis = get_redis()
+        version = await redis.get(key)
+        if version is None:
+            version = str(time.time_ns())
+            if not await redis.set(key, version, nx=True, ex=MENU_VERSION_TTL):
+                version = await redis.get(key)
+        return version
+    except Exception as e:
+        logger.warning("food_cache_unavailable", error=str(e))
+        return None
+
+
 # ───────────────────────────────────────────────
 # 1. Get Vendors (Nearby or All)
 # ───────────────────────────────────────────────
 async def get_food_vendors(
     supabase: AsyncClient, lat: Optional[float] = None, lng: Optional[float] = None
 ) -> List[VendorCardResponse]:
-    params = {"near_lat": lat, "near_lng": lng} if lat and lng else {}
-    resp = await supabase.rpc("get_food_vendors", params).execute()
-    return [VendorCardResponse(**v) for v in resp.data]
+    params = {}
+    if lat and lng:
+        params = {
+            "near_lat": round(lat, VENDORS_COORD_PRECISION),
+            "near_lng": round(lng, VENDORS_COORD_PRECISION),
+        }
+    cache_key = f"food:vendors:v1:{params.get('near_lat')}:{params.get('near_lng')}"
+
+    async def load() -> bytes:
+        resp = await supabase.rpc("get_food_vendors", params).execute()
+        try:
+            redis = get_redis()
+            await redis.sadd(VENDORS_CACHE_INDEX, cache_key)
+            await redis.expire(VENDORS_CACHE_INDEX, VENDORS_CACHE_TTL)
+        except Exception as e:
+            logger.warning("food_cache_unavailable", error=str(e))
+        return _vendor_cards.dump_json([VendorCardResponse(**v) for v in resp.data])
+
+    cached = await get_or_load_cached(cache_key, VENDORS_CACHE_TTL, load)
+    return _vendor_cards.validate_json(cached)
 
 
 # ───────────────────────────────────────────────
@@ -36,6 +125,19 @@ async def get_food_vendors(
 # ───────────────────────────────────────────────
 async def get_vendor_detail(
     vendor_id: UUID, supabase: AsyncClient
+) -> VendorDetailResponse:
+    async def load() -> str:
+        detail = await _load_vendor_detail(vendor_id, supabase)
+        return detail.model_dump_json()
+
+    cached = await get_or_load_cached(
+        _vendor_menu_key(vendor_id), VENDOR_MENU_CACHE_TTL, load
+    )
+    return VendorDetailResponse.model_validate_json(cached)
+
+
+async def _load_vendor_detail(
+    vendor_id: UUID, supabase: AsyncClient
 ) -> VendorDetailResponse:
     resp = await supabase.rpc(
         "get_vendor_detail_with_menu", {"vendor_user_id": str(vendor_id)}
@@ -405,6 +507,9 @@ async def create_food_item_with_images(
     logger.info(
         "create_food_item", vendor_id=str(vendor_id), name=name, price=float(price)
     )
+    if len(images) > MAX_MENU_ITEM_IMAGES:
+        raise HTTPException(400, f"At most {MAX_MENU_ITEM_IMAGES} images per item")
+
     try:
         item_data = {
             "vendor_id": str(vendor_id),
@@ -418,15 +523,20 @@ async def create_food_item_with_images(
         resp = await supabase.table("food_items").insert(item_data).execute()
         item_id = resp.data[0]["id"]
 
-        image_urls = []
-        for file in images:
-            url = await upload_to_supabase_storage(
-                file=file,
-                bucket="menu-images",
-                folder=f"vendor_{vendor_id}/item_{item_id}",
-                supabase=supabase,
+        # Each upload streams its file; run them side by side, order preserved
+        image_urls = list(
+            await asyncio.gather(
+                *(
+                    upload_to_supabase_storage(
+                        file=file,
+                        bucket="menu-images",
+                        folder=f"vendor_{vendor_id}/item_{item_id}",
+                        supabase=supabase,
+                    )
+                    for file in images
+                )
             )
-            image_urls.append(url)
+        )
 
         if image_urls:
             await (
@@ -469,6 +579,9 @@ async def create_food_item_with_images(
             exc_info=True,
         )
         raise HTTPException(500, f"Failed to create item: {str(e)}")
+    finally:
+        # The row may exist even if a later step failed
+        await invalidate_vendor_menu(vendor_id)
 
 
 # ───────────────────────────────────────────────
@@ -508,6 +621,7 @@ async def update_food_item(
         .eq("id", str(item_id))
         .execute()
     )
+    await invalidate_vendor_menu(vendor_id)
 
     new_value = resp.data[0]
 
@@ -563,6 +677,7 @@ async def delete_food_item(
         .eq("id", str(item_id))
         .execute()
     )
+    await invalidate_vendor_menu(vendor_id)
 
     # Audit log
     await log_audit_event(
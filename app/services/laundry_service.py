@@ -1,10 +1,12 @@
+import asyncio
 from uuid import UUID
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict
 from decimal import Decimal
 from fastapi import HTTPException, status, Request
-from app.utils.redis_utils import save_pending
+from pydantic import TypeAdapter
+from app.utils.redis_utils import get_or_load_cached, save_pending
 from app.schemas.common import (
     VendorOrderAction,
     PaymentInitializationResponse,
@@ -28,6 +30,15 @@ from app.schemas.common import VendorResponse
 from app.config.logging import logger
 from app.utils.audit import log_audit_event
 
+# Vendor listings are the same for every customer in an area; cached briefly
+VENDORS_CACHE_TTL = 60
+# ~110 m: nearby searches from the same area share one cache entry
+VENDORS_COORD_PRECISION = 3
+
+MAX_MENU_ITEM_IMAGES = 5
+
+_vendor_list = TypeAdapter(List[VendorResponse])
+
 
 # ───────────────────────────────────────────────
 # Vendors & Detail
@@ -35,9 +46,20 @@ from app.utils.audit import log_audit_event
 async def get_laundry_vendors(
     supabase: AsyncClient, lat: Optional[float] = None, lng: Optional[float] = None
 ) -> List[VendorResponse]:
-    params = {"near_lat": lat, "near_lng": lng} if lat and lng else {}
-    resp = await supabase.rpc("get_laundry_vendors", params).execute()
-    return [VendorResponse(**v) for v in resp.data]
+    params = {}
+    if lat and lng:
+        params = {
+            "near_lat": round(lat, VENDORS_COORD_PRECISION),
+            "near_lng": round(lng, VENDORS_COORD_PRECISION),
+        }
+    cache_key = f"laundry:vendors:v1:{params.get('near_lat')}:{params.get('near_lng')}"
+
+    async def load() -> bytes:
+        resp = await supabase.rpc("get_laundry_vendors", params).execute()
+        return _vendor_list.dump_json([VendorResponse(**v) for v in resp.data])
+
+    cached = await get_or_load_cached(cache_key, VENDORS_CACHE_TTL, load)
+    return _vendor_list.validate_json(cached)
 
 
 async def get_laundry_vendor_detail(
@@ -328,6 +350,9 @@ async def create_laundry_item_with_images(
 ) -> dict:
     if images is None:
         images = []
+    if len(images) > MAX_MENU_ITEM_IMAGES:
+        raise HTTPException(400, f"At most {MAX_MENU_ITEM_IMAGES} images per item")
+
     try:
         item_resp = (
             await supabase.table("laundry_items")
@@ -344,15 +369,20 @@ async def create_laundry_item_with_images(
 
         item_id = item_resp.data[0]["id"]
 
-        image_urls = []
-        for file in images:
-            url = await upload_to_supabase_storage(
-                file=file,
-                bucket="menu-images",
-                folder=f"vendor_{vendor_id}/laundry_item_{item_id}",
-                supabase=supabase,
+        # Each upload streams its file; run them side by side, order preserved
+        image_urls = list(
+            await asyncio.gather(
+                *(
+                    upload_to_supabase_storage(
+                        file=file,
+                        bucket="menu-images",
+                        folder=f"vendor_{vendor_id}/laundry_item_{item_id}",
+                        supabase=supabase,
+                    )
+                    for file in images
+                )
             )
-            image_urls.append(url)
+        )
 
         if image_urls:
             await (
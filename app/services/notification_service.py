@@ -11,6 +11,7 @@ from exponent_server_sdk import (
 )
 from requests.exceptions import ConnectionError, HTTPError
 from app.config.logging import logger
+from app.database.supabase import get_supabase_admin_client
 from datetime import datetime
 
 
@@ -75,9 +76,7 @@ async def notify_user(
     Helper to fetch a user's push token and send them a notification.
     """
     if not supabase:
-        from app.database.supabase import create_supabase_admin_client
-
-        supabase = await create_supabase_admin_client()
+        supabase = await get_supabase_admin_client()
 
     token_data = await get_my_fcm_token(user_id, supabase)
     if not token_data or not token_data.token:
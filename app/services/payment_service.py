@@ -6,7 +6,30 @@ from app.utils.audit import log_audit_event
 from typing import Optional
 from fastapi import Request
 from decimal import Decimal
-from app.utils.payment import verify_transaction_tx_ref
+from app.utils.payment import close_flutterwave_client, verify_transaction_tx_ref
+from app.database.redis import close_redis
+from app.database.supabase import close_supabase_clients, get_supabase_admin_client
+
+
+# ───────────────────────────────────────────────
+# Background job entry point
+# ───────────────────────────────────────────────
+async def run_payment_job(
+    handler, tx_ref: str, paid_amount: float, flw_ref: str, audit: dict
+):
+    """
+    RQ entry point for the `process_successful_*` handlers queued by the
+    webhook. Jobs only carry plain values; the Supabase client is created here.
+    RQ runs every async job on a fresh event loop, so the shared clients bound
+    to it are closed before the loop is discarded.
+    """
+    try:
+        supabase = await get_supabase_admin_client()
+        return await handler(tx_ref, paid_amount, flw_ref, supabase, request=audit)
+    finally:
+        await close_supabase_clients()
+        await close_redis()
+        await close_flutterwave_client()
 
 
 # ───────────────────────────────────────────────
@@ -17,7 +40,7 @@ async def process_successful_delivery_payment(
     paid_amount: float,
     flw_ref: str,
     supabase: AsyncClient,
-    request: Optional[Request] = None,
+    request: Optional[Request | dict] = None,
 ):
     logger.info("processing_delivery_payment", tx_ref=tx_ref, paid_amount=paid_amount)
     verified = await verify_transaction_tx_ref(tx_ref)
@@ -146,7 +169,7 @@ async def process_successful_food_payment(
     paid_amount: float,
     flw_ref: str,
     supabase: AsyncClient,
-    request: Optional[Request] = None,
+    request: Optional[Request | dict] = None,
 ):
     """
     Webhook handler for successful food order payment.
@@ -329,7 +352,7 @@ async def process_successful_topup_payment(
     paid_amount: float,
     flw_ref: str,
     supabase: AsyncClient,
-    request: Optional[Request] = None,
+    request: Optional[Request | dict] = None,
 ):
     logger.info("processing_topup_payment", tx_ref=tx_ref, paid_amount=paid_amount)
 
@@ -443,7 +466,11 @@ async def process_successful_topup_payment(
 # Product Payment
 # ───────────────────────────────────────────────
 async def process_successful_product_payment(
-    tx_ref: str, paid_amount: float, flw_ref: str, supabase: AsyncClient
+    tx_ref: str,
+    paid_amount: float,
+    flw_ref: str,
+    supabase: AsyncClient,
+    request: Optional[Request | dict] = None,
 ):
     
 
@@ -542,7 +569,12 @@ async def process_successful_product_payment(
         await delete_pending(pending_key)
 
     except Exception as e:
-        print(f"Product payment processing error for {tx_ref}: {e}")
+        logger.error(
+            "product_payment_processing_error",
+            tx_ref=tx_ref,
+            error=str(e),
+            exc_info=True,
+        )
         await delete_pending(pending_key)
         raise
 
@@ -552,7 +584,7 @@ async def process_successful_laundry_payment(
     paid_amount: float,
     flw_ref: str,
     supabase: AsyncClient,
-    request: Optional[Request] = None,
+    request: Optional[Request | dict] = None,
 ):
     """
     Handle successful payment for laundry order (webhook callback).
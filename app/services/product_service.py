@@ -1,6 +1,6 @@
 from uuid import UUID
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from app.schemas.product_schemas import (
     ProductItemCreate,
     ProductItemUpdate,
@@ -52,7 +52,8 @@ async def create_product_item(
 # ───────────────────────────────────────────────
 # READ - Get single item (public)
 # ───────────────────────────────────────────────
-async def get_product_item(item_id: UUID, supabase: AsyncClient) -> ProductItemResponse:
+async def get_product_item_row(item_id: UUID, supabase: AsyncClient) -> dict:
+    """The raw `product_items` row, for callers that check it before validating."""
     item = (
         await supabase.table("product_items")
         .select("*")
@@ -68,7 +69,11 @@ async def get_product_item(item_id: UUID, supabase: AsyncClient) -> ProductItemR
             detail="Product item not found or deleted",
         )
 
-    return ProductItemResponse(**item.data)
+    return item.data
+
+
+async def get_product_item(item_id: UUID, supabase: AsyncClient) -> ProductItemResponse:
+    return ProductItemResponse(**await get_product_item_row(item_id, supabase))
 
 
 # ───────────────────────────────────────────────
@@ -110,6 +115,7 @@ async def update_product_item(
     update_data = data.model_dump(exclude_unset=True)
     if not update_data:
         raise HTTPException(400, "No fields to update")
+    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
 
     resp = (
         await supabase.table("product_items")
@@ -140,7 +146,9 @@ async def delete_product_item(
 
     await (
         supabase.table("product_items")
-        .update({"is_deleted": True})
+        .update(
+            {"is_deleted": True, "updated_at": datetime.now(timezone.utc).isoformat()}
+        )
         .eq("id", str(item_id))
         .execute()
     )
@@ -1,6 +1,46 @@
+import time
+from typing import Optional
 from fastapi import HTTPException, status
 from supabase import AsyncClient
 from app.schemas.review_schemas import *
+from app.database.redis import get_redis
+from app.config.logging import logger
+
+# Per-entity version stamp for conditional GETs of the review list. Bumped
+# when a review is added; the TTL bounds how long reviewer names/avatars
+# in a 304'd list can lag behind profile edits.
+REVIEWS_VERSION_TTL = 3600
+
+
+def _reviews_version_key(entity_id, entity_type: str) -> str:
+    return f"reviews:version:v1:{entity_type}:{entity_id}"
+
+
+async def invalidate_entity_reviews(entity_id, entity_type: str) -> None:
+    try:
+        await get_redis().set(
+            _reviews_version_key(entity_id, entity_type),
+            str(time.time_ns()),
+            ex=REVIEWS_VERSION_TTL,
+        )
+    except Exception as e:
+        logger.warning("reviews_cache_unavailable", error=str(e))
+
+
+async def get_reviews_version(entity_id, entity_type: str) -> Optional[str]:
+    """Current version of an entity's reviews, or None if Redis is unavailable."""
+    key = _reviews_version_key(entity_id, entity_type)
+    try:
+        redis = get_redis()
+        version = await redis.get(key)
+        if version is None:
+            version = str(time.time_ns())
+            if not await redis.set(key, version, nx=True, ex=REVIEWS_VERSION_TTL):
+                version = await redis.get(key)
+        return version
+    except Exception as e:
+        logger.warning("reviews_cache_unavailable", error=str(e))
+        return None
 
 
 # ───────────────────────────────────────────────
@@ -115,6 +155,7 @@ async def create_review(
             )
             .execute()
         )
+        await invalidate_entity_reviews(reviewee_id, data.reviewee_type)
 
         return {
             "success": True,
@@ -1,13 +1,15 @@
 from typing import List
 from app.schemas.user_schemas import *
 from fastapi import HTTPException, status, UploadFile, Request
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 from supabase import AsyncClient
 from app.config.logging import logger
 from app.utils.audit import log_audit_event
+from app.services.food_service import invalidate_food_vendor
 from decimal import Decimal
-from app.config.config import redis
+from app.database.redis import get_redis
+from app.utils.storage import upload_to_supabase_storage
 from app.utils.utils import check_login_attempts, record_failed_attempt, reset_login_attempts
 
 # ───────────────────────────────────────────────
@@ -116,7 +118,7 @@ async def login_user(
     logger.info("login_attempt", email=data.email)
     
     # Check for too many failed attempts
-    await check_login_attempts(data.email, redis)
+    await check_login_attempts(data.email, get_redis())
     
     try:
         # Try phone first, then email
@@ -150,7 +152,7 @@ async def login_user(
             raise HTTPException(status_code=500, detail="Profile data parsing error")
 
         # Reset login attempts on successful login
-        await reset_login_attempts(data.email, redis)
+        await reset_login_attempts(data.email, get_redis())
 
         logger.info("login_success", user_id=session.user.id, email=data.email)
         return TokenResponse(
@@ -163,7 +165,7 @@ async def login_user(
     except Exception as e:
         logger.warning("login_failed", email=data.email, error=str(e))
         # Record failed attempt
-        await record_failed_attempt(data.email, redis)
+        await record_failed_attempt(data.email, get_redis())
         raise HTTPException(status_code=401, detail=f"Invalid credentials.")
 
 
@@ -340,6 +342,12 @@ async def get_user_profile(user_id: UUID, supabase: AsyncClient) -> UserProfileR
     return UserProfileResponse(**resp.data)
 
 
+async def _invalidate_vendor_caches(profile: dict) -> None:
+    """Drop cached food listings that show this profile, if it is a vendor's."""
+    if profile.get("user_type") == "RESTAURANT_VENDOR":
+        await invalidate_food_vendor(profile["id"])
+
+
 # ───────────────────────────────────────────────
 # 5. Update Profile
 # ───────────────────────────────────────────────
@@ -398,6 +406,7 @@ async def update_user_profile(
         raise HTTPException(status_code=404, detail="Profile not found")
 
     new_value = resp.data[0]
+    await _invalidate_vendor_caches(new_value)
 
     # Audit log
     await log_audit_event(
@@ -726,6 +735,63 @@ async def get_vendor_earnings(vendor_id: UUID, supabase: AsyncClient) -> dict:
 # ───────────────────────────────────────────────
 # 12. Upload Profile Image
 # ───────────────────────────────────────────────
+PROFILE_IMAGE_BUCKET = "profile-images"
+PROFILE_IMAGE_MIME_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
+
+
+async def _record_profile_image(
+    user_id: UUID,
+    image_type: Literal["profile", "backdrop"],
+    url: str,
+    file_info: dict,
+    supabase: AsyncClient,
+    request: Optional[Request] = None,
+) -> None:
+    """Store an uploaded image and make it the profile's active one."""
+    # Insert into profile_images table
+    await (
+        supabase.table("profile_images")
+        .insert(
+            {
+                "user_id": str(user_id),
+                "image_type": image_type,
+                "image_url": url,
+                **file_info,
+                "metadata": {},
+            }
+        )
+        .execute()
+    )
+
+    # Update profiles table with latest active URL
+    resp = (
+        await supabase.table("profiles")
+        .update({f"{image_type}_image_url": url})
+        .eq("id", str(user_id))
+        .execute()
+    )
+    if resp.data:
+        await _invalidate_vendor_caches(resp.data[0])
+
+    # Audit log
+    await log_audit_event(
+        supabase,
+        entity_type="PROFILE",
+        entity_id=str(user_id),
+        action="UPLOAD_IMAGE",
+        new_value={f"{image_type}_image_url": url},
+        actor_id=str(user_id),
+        actor_type="USER",
+        notes=f"Uploaded {image_type} image",
+        request=request,
+    )
+
+
 async def upload_profile_image(
     file: UploadFile,
     user_id: UUID,
@@ -734,8 +800,6 @@ async def upload_profile_image(
     request: Optional[Request] = None,
 ) -> str:
     """Upload image and return public URL"""
-    from app.utils.storage import upload_to_supabase_storage
-
     logger.info(
         "upload_profile_image_started",
         user_id=str(user_id),
@@ -745,46 +809,21 @@ async def upload_profile_image(
     try:
         folder = f"users/{user_id}/{image_type}"
         url = await upload_to_supabase_storage(
-            file=file, supabase=supabase, bucket="profile-images", folder=folder
-        )
-
-        # Insert into profile_images table
-        await (
-            supabase.table("profile_images")
-            .insert(
-                {
-                    "user_id": str(user_id),
-                    "image_type": image_type,
-                    "image_url": url,
-                    "file_path": f"{folder}/{file.filename}",
-                    "file_name": file.filename,
-                    "mime_type": file.content_type,
-                    "size_bytes": file.size,
-                    "metadata": {},
-                }
-            )
-            .execute()
-        )
-
-        # Update profiles table with latest active URL
-        await (
-            supabase.table("profiles")
-            .update({f"{image_type}_image_url": url})
-            .eq("id", str(user_id))
-            .execute()
+            file=file, supabase=supabase, bucket=PROFILE_IMAGE_BUCKET, folder=folder
         )
 
-        # Audit log
-        await log_audit_event(
+        await _record_profile_image(
+            user_id,
+            image_type,
+            url,
+            {
+                "file_path": f"{folder}/{file.filename}",
+                "file_name": file.filename,
+                "mime_type": file.content_type,
+                "size_bytes": file.size,
+            },
             supabase,
-            entity_type="PROFILE",
-            entity_id=str(user_id),
-            action="UPLOAD_IMAGE",
-            new_value={f"{image_type}_image_url": url},
-            actor_id=str(user_id),
-            actor_type="USER",
-            notes=f"Uploaded {image_type} image",
-            request=request,
+            request,
         )
 
         logger.info(
@@ -805,6 +844,108 @@ async def upload_profile_image(
         raise
 
 
+async def create_profile_image_upload(
+    data: ProfileImageUploadRequest, user_id: UUID, supabase: AsyncClient
+) -> ProfileImageUploadResponse:
+    """
+    Signed URL the client uploads the image to directly, so the bytes never
+    pass through the API. Size and type limits are enforced by the bucket.
+    """
+    path = f"users/{user_id}/{data.image_type}/{uuid4().hex}.{data.file_ext}"
+    try:
+        signed = await supabase.storage.from_(
+            PROFILE_IMAGE_BUCKET
+        ).create_signed_upload_url(path)
+    except Exception as e:
+        logger.error(
+            "profile_image_presign_error",
+            user_id=str(user_id),
+            error=str(e),
+            exc_info=True,
+        )
+        raise HTTPException(status_code=500, detail="Could not create upload URL")
+
+    return ProfileImageUploadResponse(
+        upload_url=signed["signed_url"], token=signed["token"], path=path
+    )
+
+
+async def commit_profile_image(
+    data: ProfileImageCommitRequest,
+    user_id: UUID,
+    supabase: AsyncClient,
+    request: Optional[Request] = None,
+) -> str:
+    """Record an image uploaded through `create_profile_image_upload`."""
+    folder = f"users/{user_id}/{data.image_type}"
+    file_name = data.path.rsplit("/", 1)[-1]
+    file_ext = file_name.rsplit(".", 1)[-1].lower()
+    if data.path != f"{folder}/{file_name}" or file_ext not in PROFILE_IMAGE_MIME_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid upload path"
+        )
+
+    bucket = supabase.storage.from_(PROFILE_IMAGE_BUCKET)
+    if not await bucket.exists(data.path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Uploaded image not found"
+        )
+
+    url = await bucket.get_public_url(data.path)
+
+    # A retried commit only re-activates the image; it is recorded once
+    existing = (
+        await supabase.table("profile_images")
+        .select("id")
+        .eq("user_id", str(user_id))
+        .eq("file_path", data.path)
+        .limit(1)
+        .execute()
+    )
+    if existing.data:
+        column = f"{data.image_type}_image_url"
+        profile = (
+            await supabase.table("profiles")
+            .select(column)
+            .eq("id", str(user_id))
+            .single()
+            .execute()
+        )
+        if profile.data and profile.data.get(column) == url:
+            return url
+        resp = (
+            await supabase.table("profiles")
+            .update({column: url})
+            .eq("id", str(user_id))
+            .execute()
+        )
+        if resp.data:
+            await _invalidate_vendor_caches(resp.data[0])
+        return url
+
+    await _record_profile_image(
+        user_id,
+        data.image_type,
+        url,
+        {
+            "file_path": data.path,
+            "file_name": file_name,
+            "mime_type": PROFILE_IMAGE_MIME_TYPES[file_ext],
+            "size_bytes": None,
+        },
+        supabase,
+        request,
+    )
+
+    logger.info(
+        "upload_profile_image_success",
+        user_id=str(user_id),
+        image_type=data.image_type,
+        url=url,
+    )
+    return url
+
+
 # ───────────────────────────────────────────────
 # 13. Update User Location
 # ───────────────────────────────────────────────
@@ -828,8 +969,8 @@ async def update_user_location(
         point_str = f"POINT({data.longitude} {data.latitude})"
 
         # Update location
-        await (
-            supabase.table("profiles")
+        resp = (
+            await supabase.table("profiles")
             .update(
                 {
                     "location_coordinates": point_str,
@@ -839,6 +980,8 @@ async def update_user_location(
             .eq("id", str(user_id))
             .execute()
         )
+        if resp.data:
+            await _invalidate_vendor_caches(resp.data[0])
 
         return {
             "success": True,
@@ -884,12 +1027,14 @@ async def toggle_online_or_can_pickup(
         new_status = not old_status  # flip it!
 
         # 2. Update
-        await (
-            supabase.table("profiles")
+        resp = (
+            await supabase.table("profiles")
             .update({"is_online": new_status, "updated_at": datetime.now().isoformat()})
             .eq("id", str(user_id))
             .execute()
         )
+        if resp.data:
+            await _invalidate_vendor_caches(resp.data[0])
 
         is_online_msg = "online" if new_status else "offline"
         can_pickup_and_dropoff_msg = 'Pickup enabled' if new_status else 'Pickup disabled'
@@ -21,6 +21,7 @@ from app.schemas.wallet_schema import (
 )
 from app.config.config import settings
 from app.utils.redis_utils import save_pending
+from app.utils.payment import get_flutterwave_client
 from app.config.logging import logger
 from app.dependencies.auth import get_customer_contact_info
 from fastapi import HTTPException, status
@@ -557,104 +558,104 @@ async def withdraw_all_balance(
         tx_id = tx.data[0]["id"]
 
         # 6. Call Flutterwave Transfer API
-        async with httpx.AsyncClient() as client:
-            payload = {
-                "account_bank": current_profile[
-                    "bank_name"
-                ],  # example: Access Bank code – get real code from user
-                "account_number": current_profile["account_number"],
-                "amount": str(net_amount),
-                "narration": "Servipal Withdrawal",
-                "currency": "NGN",
-                "reference": reference,
-                "debit_currency": "NGN",
-                "beneficiary_name": current_profile["account_holder_name"],
-            }
-
-            headers = {
-                "Authorization": f"Bearer {settings.FLUTTERWAVE_SECRET_KEY}",
-                "Content-Type": "application/json",
-            }
-
-            resp = await client.post(
-                "https://api.flutterwave.com/v3/transfers",
-                json=payload,
-                headers=headers,
-            )
+        client = get_flutterwave_client()
+        payload = {
+            "account_bank": current_profile[
+                "bank_name"
+            ],  # example: Access Bank code – get real code from user
+            "account_number": current_profile["account_number"],
+            "amount": str(net_amount),
+            "narration": "Servipal Withdrawal",
+            "currency": "NGN",
+            "reference": reference,
+            "debit_currency": "NGN",
+            "beneficiary_name": current_profile["account_holder_name"],
+        }
 
-            fw_response = resp.json()
-
-            if resp.status_code != 200 or fw_response.get("status") != "success":
-                # Transfer failed → refund balance
-                await supabase.rpc(
-                    "update_wallet_balance",
-                    {"p_user_id": user_id, "p_delta": balance, "p_field": "balance"},
-                ).execute()
-
-                await (
-                    supabase.table("transactions")
-                    .update(
-                        {
-                            "status": "FAILED",
-                            "details": {**payload, "flutterwave_error": fw_response},
-                        }
-                    )
-                    .eq("id", tx_id)
-                    .execute()
-                )
+        headers = {
+            "Authorization": f"Bearer {settings.FLUTTERWAVE_SECRET_KEY}",
+            "Content-Type": "application/json",
+        }
 
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    f"Transfer failed: {fw_response.get('message', 'Unknown error')}",
-                )
+        resp = await client.post(
+            "https://api.flutterwave.com/v3/transfers",
+            json=payload,
+            headers=headers,
+        )
+
+        fw_response = resp.json()
+
+        if resp.status_code != 200 or fw_response.get("status") != "success":
+            # Transfer failed → refund balance
+            await supabase.rpc(
+                "update_wallet_balance",
+                {"p_user_id": user_id, "p_delta": balance, "p_field": "balance"},
+            ).execute()
 
-            # Success
             await (
                 supabase.table("transactions")
                 .update(
                     {
-                        "status": "COMPLETED",
-                        "details": {
-                            **payload,
-                            "flutterwave_ref": fw_response["data"]["reference"],
-                            "flutterwave_id": fw_response["data"]["id"],
-                        },
-                        "updated_at": datetime.utcnow().isoformat(),
+                        "status": "FAILED",
+                        "details": {**payload, "flutterwave_error": fw_response},
                     }
                 )
                 .eq("id", tx_id)
                 .execute()
             )
 
-            await log_audit_event(
-                entity_type="WITHDRAWAL",
-                entity_id=str(tx_id),
-                action="COMPLETED",
-                change_amount=-balance,
-                actor_id=user_id,
-                actor_type=current_profile["user_type"],
-                notes=f"Withdrawal of ₦{balance} (net ₦{net_amount}) completed to {current_profile['account_holder_name']}",
-                request=request,
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                f"Transfer failed: {fw_response.get('message', 'Unknown error')}",
             )
 
-            return WithdrawResponse(
-                success=True,
-                message="Withdrawal successful! Funds sent to your bank.",
-                amount_withdrawn=balance,
-                fee=fee,
-                net_amount=net_amount,
-                transaction_id=str(tx_id),
-                flutterwave_ref=fw_response["data"]["reference"],
-                status="COMPLETED",
+        # Success
+        await (
+            supabase.table("transactions")
+            .update(
+                {
+                    "status": "COMPLETED",
+                    "details": {
+                        **payload,
+                        "flutterwave_ref": fw_response["data"]["reference"],
+                        "flutterwave_id": fw_response["data"]["id"],
+                    },
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
             )
+            .eq("id", tx_id)
+            .execute()
+        )
 
-            await notify_user(
-                user_id=user_id,
-                title="Withdrawal Successful",
-                message=f"Withdrawal of ₦{balance} (net ₦{net_amount}) completed to {current_profile['account_holder_name']}",
-                notification_type="WITHDRAWAL",
-                request=request,
-            )
+        await log_audit_event(
+            entity_type="WITHDRAWAL",
+            entity_id=str(tx_id),
+            action="COMPLETED",
+            change_amount=-balance,
+            actor_id=user_id,
+            actor_type=current_profile["user_type"],
+            notes=f"Withdrawal of ₦{balance} (net ₦{net_amount}) completed to {current_profile['account_holder_name']}",
+            request=request,
+        )
+
+        return WithdrawResponse(
+            success=True,
+            message="Withdrawal successful! Funds sent to your bank.",
+            amount_withdrawn=balance,
+            fee=fee,
+            net_amount=net_amount,
+            transaction_id=str(tx_id),
+            flutterwave_ref=fw_response["data"]["reference"],
+            status="COMPLETED",
+        )
+
+        await notify_user(
+            user_id=user_id,
+            title="Withdrawal Successful",
+            message=f"Withdrawal of ₦{balance} (net ₦{net_amount}) completed to {current_profile['account_holder_name']}",
+            notification_type="WITHDRAWAL",
+            request=request,
+        )
 
     except HTTPException as he:
         raise he
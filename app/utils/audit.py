@@ -1,7 +1,71 @@
+import asyncio
+import json
+import os
+import socket
+from datetime import datetime, timezone
 from supabase import AsyncClient
 from typing import Optional
 from decimal import Decimal
 from fastapi import Request
+from redis.exceptions import ResponseError
+
+from app.config.logging import logger
+from app.database.redis import get_redis
+
+# Buffered audit writes: request handlers XADD rows here and a background
+# writer started in the app lifespan drains them into `audit_logs` in batches.
+AUDIT_STREAM = "audit:stream"
+AUDIT_GROUP = "audit-writers"
+AUDIT_STREAM_MAXLEN = 100_000
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL_MS = 500
+# Entries left unacknowledged this long (failed insert or dead writer) are
+# claimed again; after AUDIT_MAX_DELIVERIES attempts they are dead-lettered
+AUDIT_CLAIM_IDLE_MS = 60_000
+AUDIT_MAX_DELIVERIES = 5
+AUDIT_DEAD_LETTER_STREAM = "audit:dead"
+AUDIT_RETRY_DELAY = 5
+
+
+def audit_context(request: Request) -> dict:
+    """The request fields an audit row records, as a dict that can be queued."""
+    return {
+        "ip_address": request.client.host if request.client else None,
+        "user_agent": request.headers.get("user-agent"),
+    }
+
+
+def _audit_row(
+    entity_type: str,
+    entity_id: str,
+    action: str,
+    old_value: Optional[dict],
+    new_value: Optional[dict],
+    change_amount: Optional[Decimal],
+    actor_id: Optional[str],
+    actor_type: str,
+    notes: Optional[str],
+    request: Optional[Request | dict],
+) -> dict:
+    # Background jobs pass the dict from `audit_context` instead of a Request
+    if isinstance(request, dict):
+        context = request
+    else:
+        context = audit_context(request) if request else {}
+
+    return {
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "action": action,
+        "old_value": old_value,
+        "new_value": new_value,
+        "change_amount": float(change_amount) if change_amount else None,
+        "actor_id": actor_id,
+        "actor_type": actor_type,
+        "notes": notes,
+        "ip_address": context.get("ip_address"),
+        "user_agent": context.get("user_agent"),
+    }
 
 
 async def log_audit_event(
@@ -15,30 +79,188 @@ async def log_audit_event(
     actor_id: Optional[str] = None,
     actor_type: str = "SYSTEM",
     notes: Optional[str] = None,
-    request: Optional[Request] = None,
+    request: Optional[Request | dict] = None,
 ):
-    ip_address = None
-    user_agent = None
-    if request:
-        ip_address = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent")
-
-    await (
-        supabase.table("audit_logs")
-        .insert(
-            {
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "action": action,
-                "old_value": old_value,
-                "new_value": new_value,
-                "change_amount": float(change_amount) if change_amount else None,
-                "actor_id": actor_id,
-                "actor_type": actor_type,
-                "notes": notes,
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
-        )
-        .execute()
+    row = _audit_row(
+        entity_type,
+        entity_id,
+        action,
+        old_value,
+        new_value,
+        change_amount,
+        actor_id,
+        actor_type,
+        notes,
+        request,
+    )
+    await supabase.table("audit_logs").insert(row).execute()
+
+
+async def enqueue_audit_event(
+    supabase: AsyncClient,
+    entity_type: str,
+    entity_id: str,
+    action: str,
+    old_value: Optional[dict] = None,
+    new_value: Optional[dict] = None,
+    change_amount: Optional[Decimal] = None,
+    actor_id: Optional[str] = None,
+    actor_type: str = "SYSTEM",
+    notes: Optional[str] = None,
+    request: Optional[Request | dict] = None,
+):
+    """
+    Same contract as `log_audit_event`, but the row is appended to the Redis
+    audit stream and written by `run_audit_writer`. Falls back to a direct
+    insert if Redis is unavailable so no audit entry is dropped.
+    """
+    row = _audit_row(
+        entity_type,
+        entity_id,
+        action,
+        old_value,
+        new_value,
+        change_amount,
+        actor_id,
+        actor_type,
+        notes,
+        request,
     )
+    # Stamp now: the batch insert may land up to a flush interval later
+    row["created_at"] = datetime.now(timezone.utc).isoformat()
+
+    try:
+        await get_redis().xadd(
+            AUDIT_STREAM,
+            {"row": json.dumps(row, default=str)},
+            maxlen=AUDIT_STREAM_MAXLEN,
+            approximate=True,
+        )
+    except Exception as e:
+        logger.warning("audit_enqueue_failed", action=action, error=str(e))
+        await supabase.table("audit_logs").insert(row).execute()
+
+
+async def _flush_audit_entries(supabase: AsyncClient, entries: list) -> None:
+    """
+    Write the entries' rows to `audit_logs` and acknowledge the written ones.
+    A failed batch insert is retried row by row, so one bad row cannot hold
+    back the rest; rows that still fail stay pending and are claimed again.
+    """
+    entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+    if not entries:
+        return
+
+    try:
+        rows = [json.loads(fields["row"]) for _, fields in entries]
+        await supabase.table("audit_logs").insert(rows).execute()
+        written = [entry_id for entry_id, _ in entries]
+    except Exception as e:
+        logger.warning("audit_batch_insert_failed", count=len(entries), error=str(e))
+        written = []
+        for entry_id, fields in entries:
+            try:
+                row = json.loads(fields["row"])
+                await supabase.table("audit_logs").insert(row).execute()
+            except Exception as e:
+                logger.error("audit_row_insert_failed", entry_id=entry_id, error=str(e))
+            else:
+                written.append(entry_id)
+
+    if written:
+        redis = get_redis()
+        await redis.xack(AUDIT_STREAM, AUDIT_GROUP, *written)
+        await redis.xdel(AUDIT_STREAM, *written)
+
+
+async def _dead_letter_exhausted(entries: list) -> list:
+    """
+    Move entries already delivered AUDIT_MAX_DELIVERIES times to the
+    dead-letter stream and return the ones still worth retrying.
+    """
+    entries = [(entry_id, fields) for entry_id, fields in entries if fields]
+    if not entries:
+        return []
+
+    redis = get_redis()
+    delivered = {}
+    for entry_id, _ in entries:
+        pending = await redis.xpending_range(
+            AUDIT_STREAM, AUDIT_GROUP, min=entry_id, max=entry_id, count=1
+        )
+        if pending:
+            delivered[entry_id] = pending[0]["times_delivered"]
+
+    exhausted = [
+        (entry_id, fields)
+        for entry_id, fields in entries
+        if delivered.get(entry_id, 0) > AUDIT_MAX_DELIVERIES
+    ]
+    if not exhausted:
+        return entries
+
+    for entry_id, fields in exhausted:
+        await redis.xadd(
+            AUDIT_DEAD_LETTER_STREAM,
+            {"row": fields["row"], "entry_id": entry_id},
+            maxlen=AUDIT_STREAM_MAXLEN,
+            approximate=True,
+        )
+    dead = [entry_id for entry_id, _ in exhausted]
+    await redis.xack(AUDIT_STREAM, AUDIT_GROUP, *dead)
+    await redis.xdel(AUDIT_STREAM, *dead)
+    logger.error("audit_entries_dead_lettered", entry_ids=dead)
+
+    return [(entry_id, fields) for entry_id, fields in entries if entry_id not in dead]
+
+
+async def run_audit_writer(supabase: AsyncClient) -> None:
+    """
+    Drain the audit stream into `audit_logs`, up to `AUDIT_BATCH_SIZE` rows per
+    insert. Uses a consumer group so several app workers can run this loop
+    without double-writing. Each pass retries entries left pending for
+    AUDIT_CLAIM_IDLE_MS (by a failed insert or a dead writer) and then reads
+    new ones, so a stuck entry never holds up fresh rows.
+    """
+    redis = get_redis()
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+    group_ready = False
+    claim_from = "0-0"
+    while True:
+        try:
+            if not group_ready:
+                try:
+                    await redis.xgroup_create(
+                        AUDIT_STREAM, AUDIT_GROUP, id="0", mkstream=True
+                    )
+                except ResponseError:
+                    pass  # BUSYGROUP: already created by another worker
+                group_ready = True
+
+            claimed = await redis.xautoclaim(
+                AUDIT_STREAM,
+                AUDIT_GROUP,
+                consumer,
+                min_idle_time=AUDIT_CLAIM_IDLE_MS,
+                start_id=claim_from,
+                count=AUDIT_BATCH_SIZE,
+            )
+            claim_from = claimed[0]
+            retry = await _dead_letter_exhausted(claimed[1])
+            await _flush_audit_entries(supabase, retry)
+
+            resp = await redis.xreadgroup(
+                AUDIT_GROUP,
+                consumer,
+                {AUDIT_STREAM: ">"},
+                count=AUDIT_BATCH_SIZE,
+                block=AUDIT_FLUSH_INTERVAL_MS,
+            )
+            entries = resp[0][1] if resp else []
+            await _flush_audit_entries(supabase, entries)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("audit_writer_error", error=str(e), exc_info=True)
+            await asyncio.sleep(AUDIT_RETRY_DELAY)
@@ -1,4 +1,6 @@
 import json
+from typing import Optional
+
 import httpx
 from fastapi import HTTPException, status
 from app.config.config import settings
@@ -12,6 +14,29 @@ flutterwave_base_url = "https://api.flutterwave.com/v3"
 servipal_base_url = "https://servipalbackend.onrender.com/api"
 bank_url = "https://api.flutterwave.com/v3/banks/NG"
 
+# One keep-alive pool for all Flutterwave calls, closed in the app lifespan
+_flutterwave_client: Optional[httpx.AsyncClient] = None
+
+
+def get_flutterwave_client() -> httpx.AsyncClient:
+    """Return the shared Flutterwave HTTP client, creating it on first use."""
+    global _flutterwave_client
+    if _flutterwave_client is None or _flutterwave_client.is_closed:
+        _flutterwave_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=30
+            ),
+        )
+    return _flutterwave_client
+
+
+async def close_flutterwave_client() -> None:
+    global _flutterwave_client
+    if _flutterwave_client is not None:
+        await _flutterwave_client.aclose()
+        _flutterwave_client = None
+
 
 async def get_all_banks() -> list[BankSchema]:
     cache_key = "banks_list"
@@ -22,14 +47,13 @@ async def get_all_banks() -> list[BankSchema]:
     try:
         headers = {"Authorization": f"Bearer {settings.FLW_SECRET_KEY}"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(bank_url, headers=headers)
-            banks = response.json()["data"]
+        response = await get_flutterwave_client().get(bank_url, headers=headers)
+        banks = response.json()["data"]
 
-            sorted_banks = sorted(banks, key=lambda bank: bank["name"])
+        sorted_banks = sorted(banks, key=lambda bank: bank["name"])
 
-            await cache_data(cache_key, json.dumps(sorted_banks, default=str), 86400)
-            return sorted_banks
+        await cache_data(cache_key, json.dumps(sorted_banks, default=str), 86400)
+        return sorted_banks
 
     except httpx.HTTPStatusError as e:
         raise HTTPException(
@@ -73,46 +97,45 @@ async def resolve_account_details(
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{flutterwave_base_url}/accounts/resolve",
-                json=payload,
-                headers=headers,
-            )
+    client = get_flutterwave_client()
+    try:
+        response = await client.post(
+            f"{flutterwave_base_url}/accounts/resolve",
+            json=payload,
+            headers=headers,
+        )
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            # Get the raw response
-            raw_response = response.json()
+        # Get the raw response
+        raw_response = response.json()
 
-            # Extract and flatten the required fields
-            if raw_response.get("status") == "success" and "data" in raw_response:
-                data = raw_response["data"]
+        # Extract and flatten the required fields
+        if raw_response.get("status") == "success" and "data" in raw_response:
+            data = raw_response["data"]
 
-                formatted_response = {
-                    "account_number": data["account_number"],
-                    "account_name": data["account_name"],
-                }
-                return formatted_response
+            formatted_response = {
+                "account_number": data["account_number"],
+                "account_name": data["account_name"],
+            }
+            return formatted_response
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Error response from payment gateway: {e.response.status_code} - {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Network error occurred: {str(e)}")
-            raise
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Error response from payment gateway: {e.response.status_code} - {e.response.text}")
+        raise
+    except httpx.RequestError as e:
+        logger.error(f"Network error occurred: {str(e)}")
+        raise
 
 async def verify_transaction_tx_ref(tx_ref: str):
     try:
         headers = {"Authorization": f"Bearer {settings.FLW_SECRET_KEY}"}
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{flutterwave_base_url}/transactions/verify_by_reference?tx_ref={tx_ref}",
-                headers=headers,
-            )
-            response_data = response.json()
-            return response_data
+        response = await get_flutterwave_client().get(
+            f"{flutterwave_base_url}/transactions/verify_by_reference?tx_ref={tx_ref}",
+            headers=headers,
+        )
+        response_data = response.json()
+        return response_data
     except httpx.HTTPStatusError as e:
         logger.error(f"Payment gateway error: {e.response.status_code} - {e.response.text}")
         raise HTTPException(status_code=502, detail=f"Payment gateway error: {str(e)}")
@@ -1,12 +1,18 @@
+import asyncio
 import json
-from app.config.config import redis
+from typing import Awaitable, Callable
+from app.database.redis import get_redis
+from app.config.logging import logger
 from fastapi import HTTPException
 
+# In-flight cache loads per key, so concurrent misses in a worker share one
+_load_locks: dict[str, asyncio.Lock] = {}
+
 
 async def save_pending(key: str, data: dict, expire: int = 1800):
     """Save pending payment data to Redis with expiration"""
     try:
-        await redis.set(key, json.dumps(data), ex=expire)
+        await get_redis().set(key, json.dumps(data), ex=expire)
     except Exception as e:
         raise HTTPException(500, f"Redis save failed: {str(e)}")
 
@@ -14,7 +20,7 @@ async def save_pending(key: str, data: dict, expire: int = 1800):
 async def get_pending(key: str) -> dict | None:
     """Get pending payment data from Redis"""
     try:
-        json_data = await redis.get(key)
+        json_data = await get_redis().get(key)
         if json_data:
             return json.loads(json_data)
         return None
@@ -25,7 +31,7 @@ async def get_pending(key: str) -> dict | None:
 async def delete_pending(key: str):
     """Delete pending payment data from Redis"""
     try:
-        await redis.delete(key)
+        await get_redis().delete(key)
     except Exception as e:
         raise HTTPException(500, f"Redis delete failed: {str(e)}")
 
@@ -33,7 +39,7 @@ async def delete_pending(key: str):
 async def cache_data(key: str, data: str, expire: int = 86400):
     """Cache data in Redis with expiration"""
     try:
-        await redis.set(key, data, ex=expire)
+        await get_redis().set(key, data, ex=expire)
     except Exception as e:
         raise HTTPException(500, f"Redis cache failed: {str(e)}")
 
@@ -41,6 +47,82 @@ async def cache_data(key: str, data: str, expire: int = 86400):
 async def get_cached_data(key: str) -> str | None:
     """Get cached data from Redis"""
     try:
-        return await redis.get(key)
+        return await get_redis().get(key)
     except Exception as e:
         raise HTTPException(500, f"Redis get failed: {str(e)}")
+
+
+async def _get_quietly(key: str) -> str | None:
+    try:
+        return await get_redis().get(key)
+    except Exception as e:
+        logger.warning("redis_cache_unavailable", key=key, error=str(e))
+        return None
+
+
+async def get_or_load_cached(
+    key: str, ttl: int, loader: Callable[[], Awaitable[str | bytes]]
+) -> str | bytes:
+    """
+    Cache-aside read of a serialised value. On a miss `loader` produces it and
+    it is stored for `ttl` seconds; concurrent misses for the same key share
+    one load. Unlike the helpers above, Redis errors never fail the request -
+    the value is just loaded directly.
+    """
+    cached = await _get_quietly(key)
+    if cached is not None:
+        return cached
+
+    lock = _load_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            cached = await _get_quietly(key)
+            if cached is None:
+                cached = await loader()
+                try:
+                    await get_redis().set(key, cached, ex=ttl)
+                except Exception as e:
+                    logger.warning("redis_cache_unavailable", key=key, error=str(e))
+    finally:
+        if not lock.locked():
+            _load_locks.pop(key, None)
+
+    return cached
+
+
+# Refill a bucket of `burst` tokens at `rate` per second and take one.
+# Timing comes from the Redis clock so every worker sees the same bucket.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return allowed
+"""
+
+
+async def take_token(key: str, rate: float, burst: int) -> bool:
+    """
+    Take one token from the `key` bucket, which holds up to `burst` tokens and
+    refills at `rate` per second. Returns False when the bucket is empty.
+    Fails open when Redis is unavailable.
+    """
+    try:
+        allowed = await get_redis().eval(
+            _TOKEN_BUCKET_SCRIPT, 1, f"ratelimit:{key}", rate, burst
+        )
+    except Exception as e:
+        logger.warning("rate_limit_unavailable", key=key, error=str(e))
+        return True
+    return bool(allowed)
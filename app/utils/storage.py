@@ -1,8 +1,17 @@
+from typing import AsyncIterator
 from fastapi import UploadFile, HTTPException, status
 from supabase import AsyncClient
 from uuid import uuid4
 import os
 
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+async def _iter_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield the upload in fixed-size chunks so it is never held in memory whole."""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
 
 async def upload_to_supabase_storage(
     file: UploadFile,
@@ -42,22 +51,30 @@ async def upload_to_supabase_storage(
                 detail="File too large. Max 8MB",
             )
 
-        # 2. Read file content
-        contents = await file.read()
-
-        # 3. Generate unique filename
+        # 2. Generate unique filename
         file_ext = file.filename.split(".")[-1].lower()
         unique_filename = f"{uuid4().hex}.{file_ext}"
         file_path = f"{folder}/{unique_filename}" if folder else unique_filename
 
-        # 4. Upload to Supabase Storage
-        upload_resp = await supabase.storage.from_(bucket).upload(
-            path=file_path,
-            file=contents,
-            file_options={"content-type": file.content_type, "upsert": False},
+        # 3. Stream to the Storage REST endpoint over the client's shared pool
+        # (storage3's upload() only takes bytes or a real file on disk)
+        upload_resp = await supabase.options.httpx_client.post(
+            f"{supabase.storage_url}object/{bucket}/{file_path}",
+            content=_iter_chunks(file),
+            headers={
+                **supabase.options.headers,
+                "content-type": file.content_type,
+                "cache-control": "max-age=3600",
+                "x-upsert": "false",
+            },
         )
+        if upload_resp.is_error and "Duplicate" in upload_resp.text:
+            # Rare case — name already taken, retry with a new one
+            await file.seek(0)
+            return await upload_to_supabase_storage(file, supabase, bucket, folder)
+        upload_resp.raise_for_status()
 
-        # 5. Get public URL - MOVED BEFORE the print statements
+        # 4. Get public URL
         public_url = await supabase.storage.from_(bucket).get_public_url(file_path)
 
         return public_url
@@ -65,7 +82,4 @@ async def upload_to_supabase_storage(
     except HTTPException:
         raise
     except Exception as e:
-        if "Duplicate" in str(e):
-            # Rare case — retry with new name
-            return await upload_to_supabase_storage(file, supabase, bucket, folder)
         raise HTTPException(status_code=500, detail=f"Storage upload failed: {str(e)}")
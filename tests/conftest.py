@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import re
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime, timedelta
 from uuid import uuid4
@@ -7,6 +8,12 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 
 
+# The (column, id) keyset filter built by admin_service._after_cursor
+KEYSET_FILTER = re.compile(
+    r'^(\w+)\.lt\."([^"]+)",and\(\1\.eq\."\2",id\.lt\.([^)]+)\)$'
+)
+
+
 class MockResponse:
     def __init__(self, data, count=None):
         self.data = data
@@ -106,9 +113,10 @@ class MockQueryBuilder:
         self.range_val = None
         self.count_mode = None
 
-    def select(self, columns="*", count=None):
+    def select(self, columns="*", count=None, head=None):
         self.select_cols = columns
         self.count_mode = count
+        self.head = head
         return self
 
     def insert(self, data):
@@ -163,7 +171,9 @@ class MockQueryBuilder:
         return self
 
     def order(self, column, desc=False):
+        # Later calls break ties left by earlier ones, as in PostgREST
         self.order_val = (column, desc)
+        self.order_vals = getattr(self, "order_vals", []) + [(column, desc)]
         return self
 
     def limit(self, count):
@@ -178,6 +188,11 @@ class MockQueryBuilder:
         self.is_single = True
         return self
 
+    def maybe_single(self):
+        self.is_single = True
+        self.is_maybe_single = True
+        return self
+
     def _add_defaults(self, item):
         if self.table_name == "profiles":
             defaults = {
@@ -309,8 +324,14 @@ class MockQueryBuilder:
         results = self._apply_filters(table_data)
 
         if self.order_val:
-            col, desc = self.order_val
-            results.sort(key=lambda x: str(x.get(col, "")), reverse=desc)
+            # Stable sorts, least significant column first
+            for col, desc in reversed(self.order_vals):
+                results.sort(key=lambda x: str(x.get(col, "")), reverse=desc)
+
+        # Like PostgREST, the count covers every matching row, not just the page
+        total = len(results)
+        if getattr(self, "head", None):
+            return MockResponse([], count=total)
 
         if self.range_val:
             start, end = self.range_val
@@ -320,10 +341,12 @@ class MockQueryBuilder:
 
         if self.is_single:
             if not results:
+                if getattr(self, "is_maybe_single", False):
+                    return None
                 return MockResponse(None)
             return MockResponse(results[0])
 
-        return MockResponse(results, count=len(results))
+        return MockResponse(results, count=total)
 
     def _apply_filters(self, data):
         filtered = list(data)
@@ -356,6 +379,15 @@ class MockQueryBuilder:
                 filtered = [
                     r for r in filtered if str(r.get(col)) in [str(v) for v in val]
                 ]
+            elif op == "or" and KEYSET_FILTER.match(val):
+                # created_at.lt."X",and(created_at.eq."X",id.lt.Y)
+                col, value, row_id = KEYSET_FILTER.match(val).groups()
+                filtered = [
+                    r
+                    for r in filtered
+                    if str(r.get(col)) < value
+                    or (str(r.get(col)) == value and str(r.get("id")) < row_id)
+                ]
             elif op == "or":
                 if "," in val:
                     conditions = val.split(",")
@@ -367,6 +399,16 @@ class MockQueryBuilder:
                             or_results.extend(
                                 [r for r in data if str(r.get(c_col)) == str(c_val)]
                             )
+                        elif len(parts) >= 3 and parts[1] == "ilike":
+                            c_col, c_val = parts[0], ".".join(parts[2:])
+                            needle = c_val.strip("*").lower()
+                            or_results.extend(
+                                [
+                                    r
+                                    for r in filtered
+                                    if needle in str(r.get(c_col) or "").lower()
+                                ]
+                            )
                     seen = set()
                     unique_res = []
                     for r in or_results:
@@ -1,8 +1,22 @@
+import base64
 import pytest
 from uuid import uuid4
 from datetime import datetime
-from app.services.admin_service import list_users, block_unblock_user
-from app.schemas.admin_schemas import UserFilterParams, PaginationParams
+from fastapi import HTTPException
+from app.services.admin_service import (
+    _decode_cursor,
+    _encode_cursor,
+    list_users,
+    list_orders,
+    list_transactions,
+    block_unblock_user,
+)
+from app.schemas.admin_schemas import (
+    UserFilterParams,
+    OrderFilterParams,
+    TransactionFilterParams,
+    PaginationParams,
+)
 
 
 @pytest.mark.asyncio
@@ -111,3 +125,232 @@ async def test_block_user(mock_supabase):
 
     assert result.is_blocked is True
     assert result.account_status == "BLOCKED"
+
+
+@pytest.mark.asyncio
+async def test_list_users_search(mock_supabase):
+    await (
+        mock_supabase.table("profiles")
+        .insert(
+            [
+                {
+                    "id": str(uuid4()),
+                    "full_name": "Ada Lovelace",
+                    "email": "ada@example.com",
+                },
+                {
+                    "id": str(uuid4()),
+                    "full_name": "Alan Turing",
+                    "email": "alan@example.com",
+                },
+            ]
+        )
+        .execute()
+    )
+
+    filters = UserFilterParams(search="lovelace")
+    pagination = PaginationParams(page=1, page_size=10)
+
+    result = await list_users(filters, pagination, mock_supabase)
+
+    assert [u.full_name for u in result.users] == ["Ada Lovelace"]
+
+
+@pytest.mark.asyncio
+async def test_list_orders_merges_sources(mock_supabase):
+    customer_id = str(uuid4())
+    await (
+        mock_supabase.table("food_orders")
+        .insert(
+            {
+                "id": str(uuid4()),
+                "customer_id": customer_id,
+                "order_status": "PENDING",
+                "payment_status": "PAID",
+                "grand_total": 1000,
+                "created_at": "2026-01-02T00:00:00",
+            }
+        )
+        .execute()
+    )
+    await (
+        mock_supabase.table("delivery_orders")
+        .insert(
+            [
+                {
+                    "id": str(uuid4()),
+                    "sender_id": customer_id,
+                    "grand_total": 500,
+                    "created_at": f"2026-01-0{day}T00:00:00",
+                }
+                for day in (1, 3)
+            ]
+        )
+        .execute()
+    )
+
+    result = await list_orders(
+        OrderFilterParams(), PaginationParams(page=1, page_size=2), mock_supabase
+    )
+
+    assert result.total == 3
+    assert [o.order_type for o in result.orders] == ["delivery", "food"]
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_created_to_covers_whole_day(mock_supabase):
+    await (
+        mock_supabase.table("transactions")
+        .insert(
+            [
+                {
+                    "id": str(uuid4()),
+                    "tx_ref": f"TX-{i}",
+                    "amount": 100,
+                    "transaction_type": "TOP_UP",
+                    "status": "SUCCESS",
+                    "created_at": created_at,
+                }
+                for i, created_at in enumerate(
+                    ["2026-01-01T09:00:00", "2026-01-01T23:30:00", "2026-01-02T00:00:00"]
+                )
+            ]
+        )
+        .execute()
+    )
+
+    result = await list_transactions(
+        TransactionFilterParams(created_to=datetime(2026, 1, 1)),
+        PaginationParams(page=1, page_size=10),
+        mock_supabase,
+    )
+
+    assert sorted(tx.tx_ref for tx in result.transactions) == ["TX-0", "TX-1"]
+
+
+def test_cursor_round_trip():
+    row_id = str(uuid4())
+    cursor = _encode_cursor("2026-01-02T03:04:05.123456+00:00", row_id)
+
+    assert _decode_cursor(cursor) == ("2026-01-02T03:04:05.123456+00:00", row_id)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "2026-01-02T00:00:00",
+        f"yesterday|{uuid4()}",
+        "2026-01-02T00:00:00|not-a-uuid",
+        f'2026-01-02T00:00:00",id.gt.0|{uuid4()}',
+        f"2026-01-02T00:00:00|{uuid4()}|extra",
+    ],
+)
+@pytest.mark.asyncio
+async def test_tampered_cursor_is_rejected(mock_supabase, raw):
+    cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+
+    with pytest.raises(HTTPException) as exc:
+        await list_orders(
+            OrderFilterParams(),
+            PaginationParams(page=1, page_size=2),
+            mock_supabase,
+            after=cursor,
+        )
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm90IHV0Zi04\xff", "\u00e9"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        _decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+async def _walk_order_pages(mock_supabase, page_size):
+    pages, after = [], None
+    while True:
+        result = await list_orders(
+            OrderFilterParams(),
+            PaginationParams(page=1, page_size=page_size),
+            mock_supabase,
+            after=after,
+        )
+        pages.append([o.id for o in result.orders])
+        after = result.next_cursor
+        if not after:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_break_created_at_ties_by_id(mock_supabase):
+    created_at = "2026-01-02T00:00:00"
+    await (
+        mock_supabase.table("food_orders")
+        .insert(
+            [
+                {
+                    "id": str(uuid4()),
+                    "customer_id": str(uuid4()),
+                    "order_status": "PENDING",
+                    "payment_status": "PAID",
+                    "grand_total": 1000,
+                    "created_at": created_at,
+                }
+                for _ in range(5)
+            ]
+        )
+        .execute()
+    )
+    expected = sorted(
+        (row["id"] for row in mock_supabase._data["food_orders"]), reverse=True
+    )
+
+    pages = await _walk_order_pages(mock_supabase, page_size=2)
+
+    assert [str(order_id) for page in pages for order_id in page] == expected
+
+
+@pytest.mark.asyncio
+async def test_list_orders_pages_stay_ordered_across_sources(mock_supabase):
+    customer_id = str(uuid4())
+    # Interleave the two sources, with one timestamp shared between them
+    days = {"food_orders": (1, 3, 4, 6), "delivery_orders": (2, 4, 5, 7)}
+    for table, table_days in days.items():
+        await (
+            mock_supabase.table(table)
+            .insert(
+                [
+                    {
+                        "id": str(uuid4()),
+                        "customer_id": customer_id,
+                        "sender_id": customer_id,
+                        "order_status": "PENDING",
+                        "payment_status": "PAID",
+                        "grand_total": 500,
+                        "created_at": f"2026-01-0{day}T00:00:00",
+                    }
+                    for day in table_days
+                ]
+            )
+            .execute()
+        )
+    everything = mock_supabase._data["food_orders"] + mock_supabase._data[
+        "delivery_orders"
+    ]
+    expected = [
+        row["id"]
+        for row in sorted(
+            everything, key=lambda r: (r["created_at"], r["id"]), reverse=True
+        )
+    ]
+
+    offset_pages = []
+    for page in (1, 2, 3):
+        result = await list_orders(
+            OrderFilterParams(), PaginationParams(page=page, page_size=3), mock_supabase
+        )
+        offset_pages.extend(str(o.id) for o in result.orders)
+    cursor_pages = await _walk_order_pages(mock_supabase, page_size=3)
+
+    assert offset_pages == expected
+    assert [str(order_id) for page in cursor_pages for order_id in page] == expected
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import pytest
+from app.utils import audit
+
+
+class FakeStreams:
+    """Just enough of the Redis stream / consumer-group API for the writer."""
+
+    def __init__(self):
+        self.streams = {}
+        self.pending = {}  # entry_id -> times delivered
+        self.last_delivered = 0
+        self.seq = 0
+
+    async def xgroup_create(self, name, group, id="0", mkstream=False):
+        self.streams.setdefault(name, [])
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.seq += 1
+        entry_id = f"{self.seq}-0"
+        self.streams.setdefault(name, []).append((entry_id, dict(fields)))
+        return entry_id
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        (name,) = streams
+        fresh = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams.get(name, [])
+            if int(entry_id.split("-")[0]) > self.last_delivered
+        ][:count]
+        if not fresh:
+            await asyncio.sleep(0.001)
+            return []
+        for entry_id, _ in fresh:
+            self.pending[entry_id] = 1
+        self.last_delivered = int(fresh[-1][0].split("-")[0])
+        return [[name, fresh]]
+
+    async def xautoclaim(
+        self, name, group, consumer, min_idle_time, start_id="0-0", count=None
+    ):
+        claimed = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams.get(name, [])
+            if entry_id in self.pending
+        ][:count]
+        for entry_id, _ in claimed:
+            self.pending[entry_id] += 1
+        return ["0-0", claimed, []]
+
+    async def xpending_range(self, name, group, min, max, count):
+        if min in self.pending:
+            return [{"message_id": min, "times_delivered": self.pending[min]}]
+        return []
+
+    async def xack(self, name, group, *ids):
+        for entry_id in ids:
+            self.pending.pop(entry_id, None)
+
+    async def xdel(self, name, *ids):
+        self.streams[name] = [e for e in self.streams[name] if e[0] not in ids]
+
+
+class FakeAuditTable:
+    def __init__(self, written):
+        self.written = written
+        self.rows = None
+
+    def insert(self, rows):
+        self.rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    async def execute(self):
+        if any(row["action"] == "BROKEN" for row in self.rows):
+            raise ValueError("violates check constraint")
+        self.written.extend(self.rows)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.written = []
+
+    def table(self, name):
+        assert name == "audit_logs"
+        return FakeAuditTable(self.written)
+
+
+async def _enqueue(redis, action):
+    row = {"entity_type": "PROFILE", "entity_id": "u1", "action": action}
+    await redis.xadd(audit.AUDIT_STREAM, {"row": json.dumps(row)})
+
+
+@pytest.mark.asyncio
+async def test_failing_entry_does_not_block_later_ones(monkeypatch):
+    redis = FakeStreams()
+    monkeypatch.setattr(audit, "get_redis", lambda: redis)
+    monkeypatch.setattr(audit, "AUDIT_CLAIM_IDLE_MS", 0)
+    monkeypatch.setattr(audit, "AUDIT_MAX_DELIVERIES", 2)
+    supabase = FakeSupabase()
+
+    await _enqueue(redis, "BROKEN")
+    await _enqueue(redis, "UPDATE_USER")
+    writer = asyncio.create_task(audit.run_audit_writer(supabase))
+    await asyncio.sleep(0.05)
+    await _enqueue(redis, "BLOCK_USER")
+    await asyncio.sleep(0.05)
+    writer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await writer
+
+    assert [row["action"] for row in supabase.written] == [
+        "UPDATE_USER",
+        "BLOCK_USER",
+    ]
+    # The bad row was retried, then parked instead of staying pending
+    dead = redis.streams[audit.AUDIT_DEAD_LETTER_STREAM]
+    assert [json.loads(fields["row"])["action"] for _, fields in dead] == ["BROKEN"]
+    assert redis.pending == {}
+    assert redis.streams[audit.AUDIT_STREAM] == []
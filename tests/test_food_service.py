@@ -1,6 +1,11 @@
 import pytest
 from uuid import uuid4
 from decimal import Decimal
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.database.supabase import get_supabase_client
+from app.routes.food_router import restaurant_vendor_only, router as food_router
+from app.services import food_service
 from app.services.food_service import get_food_vendors, initiate_food_payment
 from app.schemas.food_schemas import CheckoutRequest, CartItem
 
@@ -83,3 +88,58 @@ async def test_initiate_food_payment(mock_supabase):
         assert result.amount == Decimal("3000")  # 1500 * 2
         assert result.currency == "NGN"
         assert result.tx_ref is not None
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+def test_menu_etag_changes_after_item_update(mock_supabase, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(food_service, "get_redis", lambda: redis)
+    vendor_id = str(uuid4())
+    item_id = str(uuid4())
+    mock_supabase._data["food_items"] = [
+        {
+            "id": item_id,
+            "vendor_id": vendor_id,
+            "name": "Jollof Rice",
+            "description": None,
+            "price": 2500,
+            "stock": None,
+            "in_stock": True,
+            "category": None,
+            "is_deleted": False,
+        }
+    ]
+    app = FastAPI()
+    app.include_router(food_router)
+    app.dependency_overrides[restaurant_vendor_only] = lambda: {"id": vendor_id}
+    app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+    client = TestClient(app)
+
+    first = client.get("/api/v1/food/menu")
+    etag = first.headers["etag"]
+    cached = client.get("/api/v1/food/menu", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.patch(f"/api/v1/food/menu/items/{item_id}", json={"price": 3000})
+    after = client.get("/api/v1/food/menu", headers={"If-None-Match": etag})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert Decimal(after.json()["items"][0]["price"]) == 3000
@@ -0,0 +1,77 @@
+import base64
+import hashlib
+import hmac
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.database.supabase import get_supabase_client
+from app.routes import payment_route
+
+SECRET_HASH = "test-secret-hash"
+WEBHOOK_URL = "/api/v1/payment/webhook"
+IGNORED_EVENT = {"event": "transfer.completed", "data": {"status": "successful"}}
+
+
+def _sign(body: bytes) -> str:
+    digest = hmac.new(SECRET_HASH.encode(), body, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    settings = payment_route.settings.model_copy(
+        update={"FLW_SECRET_HASH": SECRET_HASH}
+    )
+    monkeypatch.setattr(payment_route, "settings", settings)
+    app = FastAPI()
+    app.include_router(payment_route.router)
+    app.dependency_overrides[get_supabase_client] = lambda: None
+    return TestClient(app)
+
+
+def test_valid_signature_is_accepted(client):
+    body = json.dumps(IGNORED_EVENT).encode()
+    response = client.post(
+        WEBHOOK_URL, content=body, headers={"flutterwave-signature": _sign(body)}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ignored"
+
+
+def test_tampered_body_is_rejected(client):
+    body = json.dumps(IGNORED_EVENT).encode()
+    tampered = body.replace(b"transfer", b"charge")
+    response = client.post(
+        WEBHOOK_URL, content=tampered, headers={"flutterwave-signature": _sign(body)}
+    )
+
+    assert response.status_code == 401
+
+
+def test_missing_signature_is_rejected(client):
+    response = client.post(WEBHOOK_URL, json=IGNORED_EVENT)
+
+    assert response.status_code == 401
+
+
+def test_legacy_verif_hash_is_accepted(client):
+    response = client.post(
+        WEBHOOK_URL, json=IGNORED_EVENT, headers={"verif-hash": SECRET_HASH}
+    )
+    assert response.status_code == 200
+
+    response = client.post(
+        WEBHOOK_URL, json=IGNORED_EVENT, headers={"verif-hash": "not-the-hash"}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("body", [b"", b"not json", b"[1, 2]", b"\xff\xfe"])
+def test_signed_but_unparseable_body_is_a_bad_request(client, body):
+    response = client.post(
+        WEBHOOK_URL, content=body, headers={"flutterwave-signature": _sign(body)}
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware import rate_limit
+from app.utils import redis_utils
+
+WEBHOOK_PATH = "/api/v1/payment/webhook"
+
+
+class BrokenRedis:
+    async def eval(self, *args):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def app(monkeypatch):
+    settings = rate_limit.settings.model_copy(update={"FLW_SECRET_HASH": "secret"})
+    monkeypatch.setattr(rate_limit, "settings", settings)
+    app = FastAPI()
+
+    @app.post(WEBHOOK_PATH)
+    async def webhook():
+        return {"status": "ok"}
+
+    @app.post("/other")
+    async def other():
+        return {"status": "ok"}
+
+    app.add_middleware(rate_limit.WebhookRateLimitMiddleware, path=WEBHOOK_PATH)
+    return app
+
+
+def test_empty_bucket_returns_429(app, monkeypatch):
+    take_token = AsyncMock(return_value=False)
+    monkeypatch.setattr(rate_limit, "take_token", take_token)
+
+    response = TestClient(app).post(WEBHOOK_PATH, json={})
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    key, rate, burst = take_token.await_args.args
+    assert key == "webhook:testclient"
+    assert (rate, burst) == (rate_limit.WEBHOOK_RATE, rate_limit.WEBHOOK_BURST)
+
+
+def test_verif_hash_callers_get_their_own_bucket_per_ip(app, monkeypatch):
+    take_token = AsyncMock(return_value=True)
+    monkeypatch.setattr(rate_limit, "take_token", take_token)
+
+    response = TestClient(app).post(
+        WEBHOOK_PATH, json={}, headers={"verif-hash": "secret"}
+    )
+
+    assert response.status_code == 200
+    assert take_token.await_args.args[0] == "webhook:signed:testclient"
+
+
+def test_other_paths_are_not_limited(app, monkeypatch):
+    take_token = AsyncMock(return_value=False)
+    monkeypatch.setattr(rate_limit, "take_token", take_token)
+
+    response = TestClient(app).post("/other")
+
+    assert response.status_code == 200
+    take_token.assert_not_awaited()
+
+
+def test_fails_open_when_redis_errors(app, monkeypatch):
+    monkeypatch.setattr(redis_utils, "get_redis", lambda: BrokenRedis())
+
+    response = TestClient(app).post(WEBHOOK_PATH, json={})
+
+    assert response.status_code == 200
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+from app.database import supabase as supabase_db
+
+
+@pytest.fixture
+def captured_requests(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    pool = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(supabase_db, "_http_client", pool)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_request_clients_do_not_share_auth_headers(captured_requests):
+    first = await supabase_db.get_supabase_client()
+    second = await supabase_db.get_supabase_client()
+
+    first.postgrest.auth("token-a")
+    await first.table("profiles").select("id").execute()
+    await second.table("profiles").select("id").execute()
+
+    assert captured_requests[0].headers["authorization"] == "Bearer token-a"
+    assert captured_requests[1].headers["authorization"] != "Bearer token-a"
+    # Both ran over the one shared pool, which itself carries no credentials
+    assert first.options.httpx_client is second.options.httpx_client
+    assert "authorization" not in supabase_db._http_client.headers
+
+
+@pytest.mark.asyncio
+async def test_admin_and_anon_clients_keep_their_keys(captured_requests):
+    anon = await supabase_db.get_supabase_client()
+    admin = await supabase_db.get_supabase_admin_client()
+
+    await admin.table("profiles").select("id").execute()
+    await anon.table("profiles").select("id").execute()
+
+    admin_headers, anon_headers = (r.headers for r in captured_requests)
+    assert admin_headers["apikey"] == supabase_db.settings.SUPABASE_SECRET_KEY
+    assert anon_headers["apikey"] == supabase_db.settings.SUPABASE_PUBLISHABLE_KEY
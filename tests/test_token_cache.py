@@ -0,0 +1,32 @@
+import time
+from app.utils.token_cache import ValidTokenCache
+
+
+def test_token_cache_hit_and_evict():
+    cache = ValidTokenCache(maxsize=10, ttl=60)
+    cache.set("token-a", {"id": "user-a"})
+
+    assert cache.get("token-a") == {"id": "user-a"}
+    assert cache.get("token-b") is None
+
+    cache.evict("token-a")
+    assert cache.get("token-a") is None
+
+
+def test_token_cache_respects_token_exp():
+    cache = ValidTokenCache(maxsize=10, ttl=60)
+    cache.set("expired", {"id": "user-a"}, exp=time.time() - 1)
+
+    assert cache.get("expired") is None
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = ValidTokenCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 from fastapi import HTTPException
 
+from app.services import food_service
 from app.services.user_service import (
     create_user_account,
     login_user,
@@ -89,6 +90,57 @@ async def test_update_user_profile(mock_supabase):
     assert profiles[0]["full_name"] == "New Name"
 
 
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, **kwargs):
+        self.data[key] = value
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def smembers(self, key):
+        return self.data.get(key, set())
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_update_vendor_profile_clears_food_caches(mock_supabase, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(food_service, "get_redis", lambda: redis)
+    vendor_id = uuid4()
+    await (
+        mock_supabase.table("profiles")
+        .insert(
+            {
+                "id": str(vendor_id),
+                "store_name": "Old Kitchen",
+                "user_type": "RESTAURANT_VENDOR",
+                "can_pickup_and_dropoff": False,
+            }
+        )
+        .execute()
+    )
+    listing_key = "food:vendors:v1:None:None"
+    await redis.set(food_service._vendor_menu_key(vendor_id), "{}")
+    await redis.set(listing_key, "[]")
+    await redis.sadd(food_service.VENDORS_CACHE_INDEX, listing_key)
+
+    await update_user_profile(
+        vendor_id, ProfileUpdate(store_name="New Kitchen"), mock_supabase
+    )
+
+    assert await redis.get(food_service._vendor_menu_key(vendor_id)) is None
+    assert await redis.get(listing_key) is None
+
+
 @pytest.mark.asyncio
 async def test_create_rider_by_dispatch(mock_supabase):
     dispatch_id = uuid4()
@@ -8,6 +8,7 @@ from app.services.wallet_service import (
     pay_with_wallet,
 )
 from app.schemas.wallet_schema import TopUpRequest, PayWithWalletRequest
+from app.config.config import settings
 
 
 @pytest.mark.asyncio
@@ -72,12 +73,12 @@ async def test_initiate_wallet_top_up(mock_supabase):
             "app.services.wallet_service.get_customer_contact_info", mock_get_contact
         )
 
-        # Mock settings.FLUTTERWAVE_PUBLIC_KEY
-        m.setattr(
-            "app.services.wallet_service.settings.FLUTTERWAVE_PUBLIC_KEY",
-            "FLWPUBK-TEST",
+        # Mock settings.FLUTTERWAVE_PUBLIC_KEY (settings are frozen, so swap a copy)
+        test_settings = settings.model_copy(
+            update={"FLUTTERWAVE_PUBLIC_KEY": "FLWPUBK-TEST"}
         )
-        m.setattr("app.config.config.settings.FLUTTERWAVE_PUBLIC_KEY", "FLWPUBK-TEST")
+        m.setattr("app.services.wallet_service.settings", test_settings)
+        m.setattr("app.config.config.settings", test_settings)
 
         result = await initiate_wallet_top_up(data, user_id, mock_supabase)
 